@@ -1,8 +1,10 @@
 import json
+import orjson
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple, Any
 from urllib.parse import unquote
 from dataclasses import dataclass
+import hashlib
 import re
 import spacy
 from minio import Minio
@@ -113,14 +115,14 @@ class ProcessedContent:
 
 
 class DataReader:
-    # Define canonical role sets.
-    EXECUTIVE_ROLES = {
+    # Define canonical role sets (frozen: hashed once, never mutated).
+    EXECUTIVE_ROLES = frozenset({
         "Chief Executive Officer", "Chief Operating Officer", "President", "Vice President",
         "Corporate Secretary", "Chief Financial Officer"
-    }
-    BOARD_ROLES = {
+    })
+    BOARD_ROLES = frozenset({
         "Director", "Chairman", "Board Member"
-    }
+    })
 
     def __init__(self, minio_client: Minio, bucket_name: str):
         self.bucket_name = bucket_name
@@ -188,25 +190,25 @@ class DataReader:
         try:
             temp_dir = Path("data/temp")
             temp_dir.mkdir(parents=True, exist_ok=True)
-            temp_file = temp_dir / "temp.json"
+            # Unique per object so concurrent readers don't clobber each other
+            temp_file = temp_dir / f"temp_{hashlib.md5(object_name.encode()).hexdigest()}.json"
             try:
                 self.minio_client.fget_object(self.bucket_name, object_name, str(temp_file))
             except Exception as e:
                 logger.error(f"Error downloading file {object_name}: {str(e)}")
                 return None
             try:
-                with open(temp_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            except json.JSONDecodeError as e:
-                logger.error(f"Error parsing JSON from {object_name}: {str(e)}")
-                return None
-            except UnicodeDecodeError:
+                raw = temp_file.read_bytes()
                 try:
-                    with open(temp_file, 'r', encoding='latin-1') as f:
-                        data = json.load(f)
-                except Exception as e2:
-                    logger.error(f"Error reading file with alternate encoding {object_name}: {str(e2)}")
-                    return None
+                    data = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # orjson requires valid UTF-8; retry via latin-1 like the
+                    # old alternate-encoding path before giving up
+                    try:
+                        data = json.loads(raw.decode('latin-1'))
+                    except Exception as e2:
+                        logger.error(f"Error parsing JSON from {object_name}: {str(e2)}")
+                        return None
             finally:
                 if temp_file.exists():
                     temp_file.unlink()
@@ -0,0 +1,50 @@
+"""Shared PostgreSQL connection pool for scripts and services."""
+
+import os
+from contextlib import contextmanager
+
+import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
+from dotenv import load_dotenv
+
+load_dotenv()
+
+_pool = None
+
+def get_pool() -> ThreadedConnectionPool:
+    """Return the process-wide connection pool, creating it on first use.
+
+    The pool is created lazily so importing this module never opens a
+    connection; repeated callers within one process reuse the same
+    already-authenticated connections instead of paying the TCP and
+    auth handshake per call.
+    """
+    global _pool
+    if _pool is None:
+        _pool = ThreadedConnectionPool(
+            minconn=2,
+            maxconn=16,
+            host=os.getenv('PG_HOST'),
+            port=os.getenv('PG_PORT'),
+            dbname=os.getenv('PG_DB'),
+            user=os.getenv('PG_USER'),
+            password=os.getenv('PG_PASS')
+        )
+    return _pool
+
+@contextmanager
+def pooled_connection():
+    """Borrow a connection from the shared pool and return it afterwards."""
+    pool = get_pool()
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn)
+
+def close_pool() -> None:
+    """Close every pooled connection (for shutdown/teardown)."""
+    global _pool
+    if _pool is not None:
+        _pool.closeall()
+        _pool = None
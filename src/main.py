@@ -389,7 +389,8 @@ def main():
     logger.info(f"Found files for {len(domains)} unique domains")
     
     # Get companies from database
-    companies = services['db_service'].get_all_companies()
+    # Materialized because this debug path slices and indexes the result
+    companies = list(services['db_service'].get_all_companies())
     logger.info(f"Found {len(companies)} companies in database")
     
     # Log sample company keys
@@ -14,10 +14,15 @@ class Exchange(Enum):
     TSX = "TSX"    # Toronto Stock Exchange
 
 
-@dataclass
+@dataclass(slots=True)
 class Company:
-    """Class representing a mining company."""
-    
+    """Class representing a mining company.
+
+    Slotted: bulk reads build one instance per row, and slot storage
+    drops the per-instance __dict__ (hundreds of bytes each at scale)
+    while making attribute access a fixed-offset lookup.
+    """
+
     id: Optional[int]
     website: str
     company_name: str
@@ -30,6 +35,16 @@ class Company:
     board_members: List[Dict[str, str]]
     data_source: Dict[str, str]
     
+    @property
+    def url(self) -> str:
+        """Alias for website, the name CSV-based callers use."""
+        return self.website
+
+    @property
+    def name(self) -> str:
+        """Alias for company_name, the name CSV-based callers use."""
+        return self.company_name
+
     @classmethod
     def from_dict(cls, data: Dict) -> 'Company':
         """Create a Company instance from a dictionary.
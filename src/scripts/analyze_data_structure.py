@@ -6,6 +6,8 @@ from typing import Dict, List, Any
 import random
 from collections import defaultdict
 
+import numpy as np
+
 from src.services.minio_service import MinioService
 
 def analyze_json_structure(data: Any, path: str = "", structure: Dict = None) -> Dict:
@@ -20,22 +22,57 @@ def analyze_json_structure(data: Any, path: str = "", structure: Dict = None) ->
         Dictionary containing structure information
     """
     if structure is None:
-        structure = defaultdict(list)
-        
+        structure = defaultdict(lambda: defaultdict(int))
+
     if isinstance(data, dict):
         for key, value in data.items():
             new_path = f"{path}.{key}" if path else key
-            structure[new_path].append(type(value).__name__)
+            # Compute the type name once per visit and count it directly
+            # instead of appending strings to re-aggregate later
+            tname = type(value).__name__
+            structure[new_path][tname] += 1
             analyze_json_structure(value, new_path, structure)
     elif isinstance(data, list):
         if data:
-            structure[path].append(f"list[{type(data[0]).__name__}]")
+            structure[path][f"list[{type(data[0]).__name__}]"] += 1
             analyze_json_structure(data[0], path, structure)
         else:
-            structure[path].append("list[empty]")
-            
+            structure[path]["list[empty]"] += 1
+
     return structure
 
+def collect_structure_pairs(data: Any, path: str, path_ids: Dict[str, int],
+                            type_ids: Dict[str, int], pairs: List) -> None:
+    """Walk a parsed JSON object emitting interned (path_id, type_id) pairs.
+
+    Path and type-name strings are interned to small integer IDs so the
+    cross-file aggregation can run as a single numpy reduction over an
+    int32 array instead of dicts of strings.
+
+    Args:
+        data: The JSON data to walk
+        path: Current path in the JSON structure
+        path_ids: Mapping of path string -> integer ID (extended in place)
+        type_ids: Mapping of type name -> integer ID (extended in place)
+        pairs: List of (path_id, type_id) tuples (extended in place)
+    """
+    if isinstance(data, dict):
+        for key, value in data.items():
+            new_path = f"{path}.{key}" if path else key
+            tname = type(value).__name__
+            pairs.append((path_ids.setdefault(new_path, len(path_ids)),
+                          type_ids.setdefault(tname, len(type_ids))))
+            collect_structure_pairs(value, new_path, path_ids, type_ids, pairs)
+    elif isinstance(data, list):
+        if data:
+            tname = f"list[{type(data[0]).__name__}]"
+            pairs.append((path_ids.setdefault(path, len(path_ids)),
+                          type_ids.setdefault(tname, len(type_ids))))
+            collect_structure_pairs(data[0], path, path_ids, type_ids, pairs)
+        else:
+            pairs.append((path_ids.setdefault(path, len(path_ids)),
+                          type_ids.setdefault("list[empty]", len(type_ids))))
+
 def main():
     """Main function to download and analyze data structure."""
     # Initialize MinIO service
@@ -56,22 +93,31 @@ def main():
     for file_path in downloaded_files:
         print(f"- {file_path}")
         
-    # Analyze structure of each file
-    all_structures = defaultdict(list)
-    
+    # Analyze structure of each file, interning paths/types to int IDs so
+    # the aggregation is a contiguous int32 array instead of string lists
+    path_ids: Dict[str, int] = {}
+    type_ids: Dict[str, int] = {}
+    pairs: List = []
+
     for file_path in downloaded_files:
         print(f"\nAnalyzing structure of {file_path}...")
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                structure = analyze_json_structure(data)
-                
-                # Merge structures
-                for path, types in structure.items():
-                    all_structures[path].extend(types)
-                    
+                collect_structure_pairs(data, "", path_ids, type_ids, pairs)
+
         except Exception as e:
             print(f"Error analyzing {file_path}: {str(e)}")
+
+    # Reduce all (path_id, type_id) pairs in one C pass
+    all_structures = defaultdict(dict)
+    if pairs:
+        pair_array = np.asarray(pairs, dtype=np.int32)
+        unique_pairs, counts = np.unique(pair_array, axis=0, return_counts=True)
+        paths = list(path_ids)
+        types = list(type_ids)
+        for (pid, tid), count in zip(unique_pairs, counts):
+            all_structures[paths[pid]][types[tid]] = int(count)
             
     # Save structure information
     output_file = Path("docs/DATA_STRUCTURE.md")
@@ -82,13 +128,8 @@ def main():
         f.write("This document describes the structure of JSON files stored in the MinIO bucket.\n\n")
         
         f.write("## Field Types\n\n")
-        for path, types in sorted(all_structures.items()):
-            # Count occurrences of each type
-            type_counts = defaultdict(int)
-            for t in types:
-                type_counts[t] += 1
-                
-            # Format type information
+        for path, type_counts in sorted(all_structures.items()):
+            # Counts were accumulated during analysis; just format them
             type_info = ", ".join(f"{t} ({count})" for t, count in type_counts.items())
             f.write(f"- `{path}`: {type_info}\n")
             
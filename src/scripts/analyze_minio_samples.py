@@ -11,22 +11,41 @@ from src.services.minio_service import MinioService
 def analyze_json_structure(data: Any, path: str = "", structure: Dict = None) -> Dict:
     """Analyze the structure of a JSON object recursively."""
     if structure is None:
-        structure = defaultdict(list)
-        
+        structure = defaultdict(lambda: defaultdict(int))
+
     if isinstance(data, dict):
         for key, value in data.items():
             new_path = f"{path}.{key}" if path else key
-            structure[new_path].append(type(value).__name__)
+            # Compute the type name once per visit and count it directly
+            # instead of appending strings to re-aggregate later
+            tname = type(value).__name__
+            structure[new_path][tname] += 1
             analyze_json_structure(value, new_path, structure)
     elif isinstance(data, list):
         if data:
-            structure[path].append(f"list[{type(data[0]).__name__}]")
+            structure[path][f"list[{type(data[0]).__name__}]"] += 1
             analyze_json_structure(data[0], path, structure)
         else:
-            structure[path].append("list[empty]")
-            
+            structure[path]["list[empty]"] += 1
+
     return structure
 
+def preview_json(data: Any, limit: int = 500) -> str:
+    """Pretty-print at most `limit` characters of a JSON document.
+
+    Uses the encoder's incremental iterencode so rendering stops as soon
+    as the preview is full, instead of serializing the whole document and
+    throwing away everything past the first `limit` characters.
+    """
+    parts = []
+    size = 0
+    for chunk in json.JSONEncoder(indent=2).iterencode(data):
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return "".join(parts)[:limit]
+
 def main():
     """Download and analyze sample files from MinIO bucket."""
     try:
@@ -52,8 +71,8 @@ def main():
             print(f"- {file_path}")
             
         # Analyze structure of each file
-        all_structures = defaultdict(list)
-        
+        all_structures = defaultdict(lambda: defaultdict(int))
+
         print("\nAnalyzing file structures...")
         for file_path in downloaded_files:
             print(f"\nAnalyzing {file_path}...")
@@ -61,14 +80,15 @@ def main():
                 with open(file_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     structure = analyze_json_structure(data)
-                    
-                    # Merge structures
-                    for path, types in structure.items():
-                        all_structures[path].extend(types)
+
+                    # Merge per-file type counts
+                    for path, type_counts in structure.items():
+                        for tname, count in type_counts.items():
+                            all_structures[path][tname] += count
                         
-                # Print sample content
+                # Print sample content (bounded; never renders the full document)
                 print("\nSample content:")
-                print(json.dumps(data, indent=2)[:500] + "...")  # Print first 500 chars
+                print(preview_json(data) + "...")  # Print first 500 chars
                     
             except Exception as e:
                 print(f"Error analyzing {file_path}: {str(e)}")
@@ -76,13 +96,8 @@ def main():
         # Print structure summary
         print("\nStructure Summary:")
         print("-" * 50)
-        for path, types in sorted(all_structures.items()):
-            # Count occurrences of each type
-            type_counts = defaultdict(int)
-            for t in types:
-                type_counts[t] += 1
-                
-            # Format type information
+        for path, type_counts in sorted(all_structures.items()):
+            # Counts were accumulated during analysis; just format them
             type_info = ", ".join(f"{t} ({count})" for t, count in type_counts.items())
             print(f"- {path}: {type_info}")
             
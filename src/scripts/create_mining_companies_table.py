@@ -66,13 +66,13 @@ def create_mining_companies_table():
             );
         """)
         
-        # Create indexes
+        # Create B-tree indexes. The GIN indexes on officers/board_members are
+        # deliberately NOT created here: building them after the bulk import
+        # (see import_companies.py) is much faster than maintaining them per-row.
         cur.execute("""
             CREATE INDEX idx_mining_companies_name ON mining_companies(company_name);
             CREATE INDEX idx_mining_companies_ticker ON mining_companies(ticker);
             CREATE INDEX idx_mining_companies_exchange ON mining_companies(exchange);
-            CREATE INDEX idx_mining_companies_officers ON mining_companies USING GIN (officers);
-            CREATE INDEX idx_mining_companies_board_members ON mining_companies USING GIN (board_members);
         """)
         
         # Create function to update updated_at timestamp
@@ -36,7 +36,9 @@ def create_mining_tables():
         # Create a cursor
         cur = conn.cursor()
         
-        # Create mining_companies table
+        # Send the whole DDL script in a single execute so table, index and
+        # trigger creation costs one client/server round trip instead of one
+        # per statement (psycopg2 happily runs multi-statement strings)
         cur.execute("""
             CREATE TABLE IF NOT EXISTS mining_companies (
                 id SERIAL PRIMARY KEY,
@@ -49,10 +51,7 @@ def create_mining_tables():
                 created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
             );
-        """)
-        
-        # Create mining_people table
-        cur.execute("""
+
             CREATE TABLE IF NOT EXISTS mining_people (
                 id SERIAL PRIMARY KEY,
                 company_id INTEGER REFERENCES mining_companies(id),
@@ -65,28 +64,22 @@ def create_mining_tables():
                 created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
             );
-        """)
-        
-        # Create indexes for better query performance
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_mining_companies_name 
+
+            CREATE INDEX IF NOT EXISTS idx_mining_companies_name
             ON mining_companies(name);
-            
-            CREATE INDEX IF NOT EXISTS idx_mining_companies_ticker 
+
+            CREATE INDEX IF NOT EXISTS idx_mining_companies_ticker
             ON mining_companies(ticker_symbol);
-            
-            CREATE INDEX IF NOT EXISTS idx_mining_people_company_id 
+
+            CREATE INDEX IF NOT EXISTS idx_mining_people_company_id
             ON mining_people(company_id);
-            
-            CREATE INDEX IF NOT EXISTS idx_mining_people_name 
+
+            CREATE INDEX IF NOT EXISTS idx_mining_people_name
             ON mining_people(name);
-            
-            CREATE INDEX IF NOT EXISTS idx_mining_people_role 
+
+            CREATE INDEX IF NOT EXISTS idx_mining_people_role
             ON mining_people(role);
-        """)
-        
-        # Create trigger function for updating updated_at timestamp
-        cur.execute("""
+
             CREATE OR REPLACE FUNCTION update_updated_at_column()
             RETURNS TRIGGER AS $$
             BEGIN
@@ -94,10 +87,7 @@ def create_mining_tables():
                 RETURN NEW;
             END;
             $$ language 'plpgsql';
-        """)
-        
-        # Create triggers for both tables
-        cur.execute("""
+
             DROP TRIGGER IF EXISTS update_mining_companies_updated_at ON mining_companies;
             CREATE TRIGGER update_mining_companies_updated_at
                 BEFORE UPDATE ON mining_companies
@@ -118,21 +108,21 @@ def create_mining_tables():
         print("\nTable structures:")
         print("-" * 50)
         
-        # Display table structures
-        for table in ['mining_companies', 'mining_people']:
-            print(f"\n{table}:")
-            cur.execute(f"""
-                SELECT column_name, data_type, character_maximum_length
-                FROM information_schema.columns
-                WHERE table_name = '{table}'
-                ORDER BY ordinal_position;
-            """)
-            
-            columns = cur.fetchall()
-            for col in columns:
-                col_name, data_type, max_length = col
-                length_info = f" (max length: {max_length})" if max_length else ""
-                print(f"  - {col_name}: {data_type}{length_info}")
+        # Display table structures (single introspection query for both tables)
+        cur.execute("""
+            SELECT table_name, column_name, data_type, character_maximum_length
+            FROM information_schema.columns
+            WHERE table_name IN ('mining_companies', 'mining_people')
+            ORDER BY table_name, ordinal_position;
+        """)
+
+        current_table = None
+        for table_name, col_name, data_type, max_length in cur.fetchall():
+            if table_name != current_table:
+                print(f"\n{table_name}:")
+                current_table = table_name
+            length_info = f" (max length: {max_length})" if max_length else ""
+            print(f"  - {col_name}: {data_type}{length_info}")
         
         # Close cursor and connection
         cur.close()
@@ -2,6 +2,7 @@
 
 import os
 import json
+import re
 from urllib.parse import unquote, urlparse
 import pandas as pd
 from collections import Counter
@@ -22,24 +23,17 @@ def extract_domain(url):
     except:
         return None
 
+# Precompiled once at import; matches the domain (minus any www.) in a
+# decoded object key like "https://www.example.com/about"
+_DOMAIN_RE = re.compile(r'://(?:www\.)?([^/\n]+)')
+
 def count_files_per_domain(bucket_files: List[str]) -> Dict[str, int]:
     """Count number of files per domain in bucket."""
-    counts = Counter()
-    
-    for file in bucket_files:
-        try:
-            # Decode URL-encoded filename
-            decoded = unquote(file)
-            # Parse URL from filename
-            parsed = urlparse(decoded)
-            # Extract domain without www
-            domain = parsed.netloc.replace('www.', '')
-            if domain:
-                counts[domain] += 1
-        except:
-            continue
-            
-    return counts
+    # Scan all decoded keys in one findall pass with the precompiled regex
+    # instead of running urlparse on every key; keys without a scheme have
+    # no domain and simply don't match, mirroring the old skip behaviour
+    buffer = "\n".join(unquote(file) for file in bucket_files)
+    return Counter(_DOMAIN_RE.findall(buffer))
 
 def get_bucket_files(minio_service: MinioService) -> List[str]:
     """Get list of all files in MinIO bucket."""
@@ -53,12 +47,11 @@ def get_bucket_files(minio_service: MinioService) -> List[str]:
 
 def analyze_companies(db: DatabaseService, bucket_files: List[str]):
     """Analyze companies from database and their presence in bucket."""
-    # Get all companies
-    companies = db.get_all_companies()
-    print(f"\nRead {len(companies)} companies from database")
-    
-    # Create DataFrame from companies
-    df = pd.DataFrame(companies)
+    # Stream companies in batches via a server-side cursor and build the
+    # DataFrame incrementally instead of materializing every row first
+    frames = [pd.DataFrame(batch) for batch in db.iter_company_batches()]
+    df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    print(f"\nRead {len(df)} companies from database")
     
     # Extract domains from company websites
     df['domain'] = df['website'].apply(extract_domain)
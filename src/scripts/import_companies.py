@@ -1,8 +1,11 @@
 """Script to import company data from CSV into the mining_companies table."""
 
+import io
 import os
 import sys
-import csv
+from itertools import islice
+import numpy as np
+import pandas as pd
 import psycopg2
 from dotenv import load_dotenv
 from psycopg2.extras import execute_values
@@ -12,7 +15,7 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..
 sys.path.append(project_root)
 
 def normalize_website_url(url):
-    """Normalize website URL by adding https:// if needed."""
+    """Normalize a single website URL by adding https:// if needed."""
     if not url:
         return None
     url = url.strip()
@@ -22,6 +25,19 @@ def normalize_website_url(url):
         url = f"https://{url}"
     return url
 
+def normalize_website_column(websites):
+    """Vectorized equivalent of normalize_website_url for a pandas Series.
+
+    Empty values come back as '' (the caller substitutes a placeholder);
+    URLs without a scheme get an https:// prefix in a single numpy op.
+    """
+    stripped = websites.fillna('').str.strip()
+    needs_prefix = stripped.ne('') & ~stripped.str.startswith(('http://', 'https://'))
+    return pd.Series(
+        np.where(needs_prefix, 'https://' + stripped, stripped),
+        index=websites.index
+    )
+
 def import_companies():
     """Import company data from CSV into the mining_companies table."""
     try:
@@ -60,51 +76,62 @@ def import_companies():
         
         print("\nReading CSV file...")
         with open(csv_file, 'r', encoding='utf-8-sig') as f:
-            # Read the first few lines for debugging
-            print("\nFirst few lines of the CSV file:")
-            for i, line in enumerate(f):
-                if i < 5:
-                    print(f"Line {i+1}: {line.strip()}")
-            
-            # Reset file pointer to beginning
-            f.seek(0)
-            
-            reader = csv.DictReader(f)
-            for i, row in enumerate(reader, start=2):  # start=2 because row 1 is header
-                # Debug output for first few rows
-                if i <= 5:
-                    print(f"\nProcessing Row {i}:")
-                    print(f"  Raw Website: '{row.get('Website', '')}'")
-                    print(f"  Company: '{row.get('Company Name', '')}'")
-                
-                # Skip rows where company name is empty
-                if not row.get('Company Name'):
-                    skipped.append(f"Row {i}: Empty company name")
-                    continue
-                
-                # Use the actual website URL from the CSV, or a placeholder if empty
-                website = normalize_website_url(row.get('Website', ''))
-                if not website:
-                    website = f"http://placeholder/{row['Company Name'].lower().replace(' ', '-')}"
-                    skipped.append(f"Row {i}: Using placeholder website")
-                
-                if i <= 5:
-                    print(f"  Processed Website: '{website}'")
-                
-                companies.append((
-                    website,
-                    row['Company Name'],
-                    row.get('Ticker', ''),
-                    row.get('Exchange', ''),
-                    None,  # headquarters_location
-                    None,  # founded_date
-                    None,  # description
-                    '[]',  # officers (empty JSONB array)
-                    '[]',  # board_members (empty JSONB array)
-                    '{"officers": null, "board_members": null}'  # data_source (JSONB)
-                ))
+            csv_text = f.read()
+
+        # Show the first few lines for debugging (islice avoids splitting
+        # the whole file into a list just to look at its head)
+        print("\nFirst few lines of the CSV file:")
+        for i, line in enumerate(islice(io.StringIO(csv_text), 5)):
+            print(f"Line {i+1}: {line.strip()}")
+
+        # Parse with pandas' C tokenizer instead of the pure-Python csv module;
+        # keep_default_na=False keeps empty cells as '' rather than NaN
+        df = pd.read_csv(io.StringIO(csv_text), dtype=str, keep_default_na=False)
+
+        # Normalize the whole Website column in one shot instead of per row
+        if 'Website' in df.columns:
+            df['Website'] = normalize_website_column(df['Website'])
+
+        # Pull each schema column out once; inside the loop the row tuple is
+        # built from positional values instead of per-row dict lookups
+        def column(name):
+            return df[name].tolist() if name in df.columns else [''] * len(df)
+
+        names = column('Company Name')
+        websites = column('Website')
+        tickers = column('Ticker')
+        exchanges = column('Exchange')
+
+        for i, (name, website, ticker, exchange) in enumerate(
+                zip(names, websites, tickers, exchanges), start=2):  # start=2 because row 1 is header
+            # Skip rows where company name is empty
+            if not name:
+                skipped.append(f"Row {i}: Empty company name")
+                continue
+
+            # Use the already-normalized website URL, or a placeholder if empty
+            if not website:
+                website = f"http://placeholder/{name.lower().replace(' ', '-')}"
+                skipped.append(f"Row {i}: Using placeholder website")
+
+            companies.append((
+                website,
+                name,
+                ticker,
+                exchange,
+                None,  # headquarters_location
+                None,  # founded_date
+                None,  # description
+                '[]',  # officers (empty JSONB array)
+                '[]',  # board_members (empty JSONB array)
+                '{"officers": null, "board_members": null}'  # data_source (JSONB)
+            ))
         
         print(f"\nPrepared {len(companies)} companies for import...")
+        if companies:
+            print("Sample of prepared rows:")
+            for website, name, *_ in companies[:5]:
+                print(f"  - {name}: {website}")
         if skipped:
             print(f"Skipped {len(skipped)} rows:")
             for msg in skipped[:5]:  # Show first 5 skipped entries
@@ -112,9 +139,22 @@ def import_companies():
             if len(skipped) > 5:
                 print(f"  ... and {len(skipped) - 5} more")
         
-        # Insert data using execute_values for better performance
-        insert_query = """
-            INSERT INTO mining_companies (
+        print("\nInserting data into database...")
+
+        # Stage the rows into an UNLOGGED table first: the staging load
+        # skips WAL entirely, and the upsert then runs as one server-side
+        # statement instead of locking live rows batch by batch
+        cur.execute("""
+            CREATE UNLOGGED TABLE IF NOT EXISTS mining_companies_staging
+                (LIKE mining_companies INCLUDING DEFAULTS);
+            ALTER TABLE mining_companies_staging DROP COLUMN IF EXISTS id;
+            TRUNCATE mining_companies_staging;
+        """)
+
+        execute_values(
+            cur,
+            """
+            INSERT INTO mining_companies_staging (
                 website,
                 company_name,
                 ticker,
@@ -126,28 +166,51 @@ def import_companies():
                 board_members,
                 data_source
             )
-            VALUES %s
-            ON CONFLICT (company_name) 
+            VALUES %s;
+            """,
+            companies,
+            template=None,
+            page_size=1000
+        )
+
+        # Single server-side upsert from staging into the live table
+        cur.execute("""
+            INSERT INTO mining_companies (
+                website, company_name, ticker, exchange,
+                headquarters_location, founded_date, description,
+                officers, board_members, data_source
+            )
+            SELECT website, company_name, ticker, exchange,
+                   headquarters_location, founded_date, description,
+                   officers, board_members, data_source
+            FROM mining_companies_staging
+            ON CONFLICT (company_name)
             DO UPDATE SET
                 website = EXCLUDED.website,
                 ticker = EXCLUDED.ticker,
                 exchange = EXCLUDED.exchange
             RETURNING id, company_name;
-        """
-        
-        print("\nInserting data into database...")
-        results = execute_values(
-            cur, 
-            insert_query, 
-            companies,
-            template=None,
-            page_size=100,
-            fetch=True
-        )
-        
+        """)
+        results = cur.fetchall()
+
+        cur.execute("DROP TABLE mining_companies_staging;")
+
         # Commit the transaction
         conn.commit()
-        
+
+        # Build the GIN indexes on the JSONB columns only after the bulk load;
+        # table creation skips them so the import doesn't pay per-row index
+        # maintenance (see create_mining_companies_table.py)
+        if companies:
+            print("\nCreating JSONB indexes (post-import)...")
+            cur.execute("""
+                CREATE INDEX IF NOT EXISTS idx_mining_companies_officers
+                    ON mining_companies USING GIN (officers);
+                CREATE INDEX IF NOT EXISTS idx_mining_companies_board_members
+                    ON mining_companies USING GIN (board_members);
+            """)
+            conn.commit()
+
         print("\nImport Results:")
         print("-" * 50)
         print(f"Total companies processed: {len(companies)}")
@@ -1,53 +1,41 @@
 """Script to initialize the database with the schema."""
 
 import os
-import psycopg2
-from dotenv import load_dotenv
+import sys
+from functools import lru_cache
 
+# Add the project root directory to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(project_root)
+
+from src.db.pool import pooled_connection
+
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), '..', 'db', 'schema.sql')
+
+@lru_cache(maxsize=1)
 def read_schema():
-    """Read the schema file."""
-    schema_path = os.path.join(os.path.dirname(__file__), '..', 'db', 'schema.sql')
-    with open(schema_path, 'r') as f:
+    """Read the schema file (cached after the first read)."""
+    with open(SCHEMA_PATH, 'r') as f:
         return f.read()
 
 def init_database():
     """Initialize the database with the schema."""
-    load_dotenv()
-    
-    # Get database connection parameters
-    host = os.getenv('PG_HOST')
-    port = os.getenv('PG_PORT')
-    dbname = os.getenv('PG_DB')
-    user = os.getenv('PG_USER')
-    password = os.getenv('PG_PASS')
-    
-    # Connect to database
-    conn = psycopg2.connect(
-        host=host,
-        port=port,
-        dbname=dbname,
-        user=user,
-        password=password
-    )
-    
-    try:
-        # Read schema
-        schema = read_schema()
-        
-        # Execute schema
-        with conn.cursor() as cur:
-            cur.execute(schema)
-        
-        # Commit changes
-        conn.commit()
-        print("Database initialized successfully")
-        
-    except Exception as e:
-        print(f"Error initializing database: {str(e)}")
-        conn.rollback()
-    
-    finally:
-        conn.close()
+    with pooled_connection() as conn:
+        try:
+            # Read schema
+            schema = read_schema()
+
+            # Execute schema
+            with conn.cursor() as cur:
+                cur.execute(schema)
+
+            # Commit changes
+            conn.commit()
+            print("Database initialized successfully")
+
+        except Exception as e:
+            print(f"Error initializing database: {str(e)}")
+            conn.rollback()
 
 if __name__ == '__main__':
-    init_database() 
\ No newline at end of file
+    init_database()
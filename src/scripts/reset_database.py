@@ -1,67 +1,47 @@
 """Script to reset the database by dropping and recreating tables."""
 
 import os
-import psycopg2
-from dotenv import load_dotenv
+import sys
+from functools import lru_cache
 
+# Add the project root directory to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(project_root)
+
+from src.db.pool import pooled_connection
+
+# The drop statements ahead of the schema re-apply; kept as one script so
+# the whole reset is a single round trip
+DROP_SQL = """
+    DROP TRIGGER IF EXISTS update_mining_companies_updated_at ON mining_companies;
+    DROP FUNCTION IF EXISTS update_updated_at_column() CASCADE;
+    DROP TABLE IF EXISTS mining_companies CASCADE;
+"""
+
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), '..', 'db', 'schema.sql')
+
+@lru_cache(maxsize=1)
 def read_schema():
-    """Read the schema file."""
-    schema_path = os.path.join(os.path.dirname(__file__), '..', 'db', 'schema.sql')
-    with open(schema_path, 'r') as f:
+    """Read the schema file (cached after the first read)."""
+    with open(SCHEMA_PATH, 'r') as f:
         return f.read()
 
 def reset_database():
     """Drop and recreate the database tables."""
-    load_dotenv()
-    
-    # Get database connection parameters
-    host = os.getenv('PG_HOST')
-    port = os.getenv('PG_PORT')
-    dbname = os.getenv('PG_DB')
-    user = os.getenv('PG_USER')
-    password = os.getenv('PG_PASS')
-    
-    # Connect to database
-    conn = psycopg2.connect(
-        host=host,
-        port=port,
-        dbname=dbname,
-        user=user,
-        password=password
-    )
-    
-    try:
-        # Drop existing tables and functions
-        with conn.cursor() as cur:
-            # Drop trigger first
-            cur.execute("""
-                DROP TRIGGER IF EXISTS update_mining_companies_updated_at ON mining_companies;
-            """)
-            
-            # Drop function with CASCADE
-            cur.execute("""
-                DROP FUNCTION IF EXISTS update_updated_at_column() CASCADE;
-            """)
-            
-            # Drop table
-            cur.execute("""
-                DROP TABLE IF EXISTS mining_companies CASCADE;
-            """)
-            
-            # Read and execute schema
-            schema = read_schema()
-            cur.execute(schema)
-        
-        # Commit changes
-        conn.commit()
-        print("Database reset successfully")
-        
-    except Exception as e:
-        print(f"Error resetting database: {str(e)}")
-        conn.rollback()
-    
-    finally:
-        conn.close()
+    with pooled_connection() as conn:
+        try:
+            # Send drops + schema as one multi-statement execute: a single
+            # client/server round trip instead of four
+            with conn.cursor() as cur:
+                cur.execute(DROP_SQL + "\n" + read_schema())
+
+            # Commit changes
+            conn.commit()
+            print("Database reset successfully")
+
+        except Exception as e:
+            print(f"Error resetting database: {str(e)}")
+            conn.rollback()
 
 if __name__ == '__main__':
-    reset_database() 
\ No newline at end of file
+    reset_database()
@@ -1,8 +1,14 @@
 """Script to test the DataReader functionality with MinIO data."""
 
-import json
+import atexit
+import orjson
+import os
+import queue
+import re
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 from tqdm import tqdm
 import logging
 
@@ -15,53 +21,88 @@ log_dir = Path("logs")
 log_dir.mkdir(exist_ok=True)
 log_file = log_dir / "test_data_reader.log"
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(log_file, mode="w", encoding="utf-8")
-    ]
-)
-logger = logging.getLogger(__name__)
+# Level comes from the environment (e.g. LOG_LEVEL=DEBUG during
+# development) instead of forcing the root logger to DEBUG for the whole
+# src/ tree, which made every logger.debug call format its message.
+#
+# The hot loop only enqueues records; a QueueListener thread does the
+# actual console/file writes so log I/O never blocks file processing.
+_log_queue = queue.Queue(-1)
+_formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+_handlers = [
+    logging.StreamHandler(),
+    logging.FileHandler(log_file, mode="w", encoding="utf-8")
+]
+for _handler in _handlers:
+    _handler.setFormatter(_formatter)
+
+_root = logging.getLogger()
+_root.setLevel(os.getenv("LOG_LEVEL", "INFO"))
+_root.addHandler(QueueHandler(_log_queue))
+_listener = QueueListener(_log_queue, *_handlers)
+_listener.start()
+atexit.register(_listener.stop)
 
-# Optionally set logging to DEBUG during development:
-logging.getLogger().setLevel(logging.DEBUG)
+logger = logging.getLogger(__name__)
 
 # Constants
 MINIO_BUCKET = "min-co-web-page-data"
 ANALYSIS_OUTPUT_FILE = Path("data/analysis_output.txt")
+HEADER_RULE = "=" * 50
+SECTION_RULE = "-" * 50
+
+
+# Compiled once into a single alternation so each URL is scanned in one
+# pass; IGNORECASE avoids allocating a lowered copy of every URL
+EXCLUDED_KEYWORDS = ["press-release", "news", "blog", "announcement", "news-room", "press-releases", "projects"]
+EXCLUDED_RE = re.compile("|".join(map(re.escape, EXCLUDED_KEYWORDS)), re.IGNORECASE)
 
 
 def is_excluded_url(url: str) -> bool:
     """Return True if the URL contains any excluded keyword."""
-    excluded_keywords = ["press-release", "news", "blog", "announcement", "news-room", "press-releases", "projects"]
-    return any(kw in url.lower() for kw in excluded_keywords)
+    return EXCLUDED_RE.search(url) is not None
 
 
 def get_company_files(minio_service: MinioService, company_domain: str) -> List[str]:
-    """Get all files for a specific company domain, excluding URLs with unwanted keywords."""
-    all_files = minio_service.list_objects()
-    return [f for f in all_files if company_domain in f and not is_excluded_url(f)]
+    """Get all files for a specific company domain, excluding URLs with unwanted keywords.
+
+    Looks the domain up in the memoized per-domain index, so running
+    several companies in one process shares a single bucket enumeration.
+    """
+    files = minio_service.list_objects_by_domain().get(company_domain, [])
+    return [f for f in files if not is_excluded_url(f)]
+
+
+# Cap on how many per-file samples are kept for manual inspection.
+SAMPLE_LIMIT = 20
 
 
-def save_sample_content(content: str, index: int):
-    """Save sample content for manual inspection."""
+def save_sample_batch(samples: List[Tuple[int, str]]):
+    """Write collected samples as a single JSONL file for manual inspection.
+
+    One file and one sequential write replace the per-document
+    open/write/close the old per-sample files paid.
+    """
+    if not samples:
+        return
     output_dir = Path("data/test_samples")
     output_dir.mkdir(parents=True, exist_ok=True)
-    sample_file = output_dir / f"sample_{index}_summary.txt"
-    sample_file.write_text(content, encoding="utf-8")
+    sample_file = output_dir / "samples.jsonl"
+    with sample_file.open("wb") as f:
+        for index, content in samples:
+            f.write(orjson.dumps({"i": index, "content": content}) + b"\n")
 
 
 def process_company_files(
     data_reader: DataReader, company_domain: str, company_name: str
-) -> Tuple[int, int, List]:
+) -> Tuple[int, int, Dict, Dict]:
     """Process all files for a specific company.
 
     Returns:
         processed_files: Number of files that yielded people.
         total_people: Total number of people extracted.
-        company_people: List of all Person objects extracted.
+        exec_people: Unique executives keyed by name.
+        board_people: Unique board members keyed by name.
     """
     logger.info(f"Processing files for {company_name} ({company_domain})")
     files = get_company_files(data_reader.minio_service, company_domain)
@@ -69,11 +110,29 @@ def process_company_files(
 
     processed_files = 0
     total_people = 0
-    company_people = []
+    # Deduplicate inline, keeping executives and board members partitioned
+    # so no post-hoc role-filtering pass over a combined list is needed
+    exec_people = {}
+    board_people = {}
+    samples = []
 
-    for i, file in enumerate(tqdm(files, desc="Processing files"), 1):
+    def fetch(file):
+        try:
+            return data_reader.read_json_file(file)
+        except Exception as e:
+            logger.error(f"Error reading file {file}: {str(e)}")
+            return None
+
+    # Fetch file contents concurrently so the per-object MinIO round trips
+    # overlap instead of serializing; extraction stays sequential below
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        # Throttle the progress refresh so fast (e.g. cached) iterations
+        # don't pay a terminal update per file
+        contents = list(tqdm(pool.map(fetch, files), total=len(files),
+                             desc="Fetching files", mininterval=1.0, miniters=100))
+
+    for i, (file, content) in enumerate(zip(files, contents), 1):
         try:
-            content = data_reader.read_json_file(file)
             if not content:
                 continue
 
@@ -81,8 +140,10 @@ def process_company_files(
             if not processed_content:
                 continue
 
-            # Save sample content for manual review.
-            save_sample_content(str(processed_content), i)
+            # Collect a bounded number of samples for manual review; they are
+            # written once, after the loop, instead of one file per document.
+            if logger.isEnabledFor(logging.DEBUG) and len(samples) < SAMPLE_LIMIT:
+                samples.append((i, str(processed_content)))
 
             exec_count = len(processed_content.executives)
             board_count = len(processed_content.board_members)
@@ -91,31 +152,37 @@ def process_company_files(
             if people_count > 0:
                 total_people += people_count
                 processed_files += 1
-                company_people.extend(processed_content.executives)
-                company_people.extend(processed_content.board_members)
-
-                logger.info(f"\nFile {i}:")
-                logger.info(f"URL: {processed_content.url}")
-                logger.info(f"Title: {processed_content.title}")
-                logger.info(f"Executives found: {exec_count}")
-                logger.info(f"Board members found: {board_count}")
-                if exec_count:
-                    logger.info("Executives/Officers:")
-                    for person in processed_content.executives:
-                        logger.info(f"- {person.name} ({person.role})")
-                        if person.contact_info:
-                            logger.info(f"  Contact: {person.contact_info}")
-                if board_count:
-                    logger.info("Board Members:")
-                    for person in processed_content.board_members:
-                        logger.info(f"- {person.name} ({person.role})")
-                        if person.contact_info:
-                            logger.info(f"  Contact: {person.contact_info}")
+                for person in processed_content.executives:
+                    exec_people[person.name] = person
+                for person in processed_content.board_members:
+                    board_people[person.name] = person
+
+                # Skip the per-file f-string formatting entirely when the
+                # handler level has been raised above INFO
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"\nFile {i}:")
+                    logger.info(f"URL: {processed_content.url}")
+                    logger.info(f"Title: {processed_content.title}")
+                    logger.info(f"Executives found: {exec_count}")
+                    logger.info(f"Board members found: {board_count}")
+                    if exec_count:
+                        logger.info("Executives/Officers:")
+                        for person in processed_content.executives:
+                            logger.info(f"- {person.name} ({person.role})")
+                            if person.contact_info:
+                                logger.info(f"  Contact: {person.contact_info}")
+                    if board_count:
+                        logger.info("Board Members:")
+                        for person in processed_content.board_members:
+                            logger.info(f"- {person.name} ({person.role})")
+                            if person.contact_info:
+                                logger.info(f"  Contact: {person.contact_info}")
         except Exception as e:
             logger.error(f"Error processing file {file}: {str(e)}")
             continue
 
-    return processed_files, total_people, company_people
+    save_sample_batch(samples)
+    return processed_files, total_people, exec_people, board_people
 
 
 def write_analysis_output(
@@ -123,65 +190,63 @@ def write_analysis_output(
     company_domain: str,
     processed_files: int,
     total_people: int,
-    company_people: List
+    exec_people: Dict,
+    board_people: Dict
 ):
-    """Write the final analysis summary to a file, including JSON output for final lists."""
-    output_lines = [
-        "Processing Summary",
-        "=" * 50,
-        f"Company: {company_name}",
-        f"Domain: {company_domain}",
-        f"Files processed: {processed_files}",
-        f"Total people found: {total_people}",
-        ""
-    ]
-
-    if company_people:
-        # Create separate unique lists for executives and board members.
-        unique_exec = list({p.name: p for p in company_people if p.role in DataReader.EXECUTIVE_ROLES}.values())
-        unique_board = list({p.name: p for p in company_people if p.role in DataReader.BOARD_ROLES}.values())
-
-        output_lines.append("=== Unique Executives/Officers ===")
-        output_lines.append("-" * 50)
-        for person in unique_exec:
-            output_lines.append(f"\nName: {person.name}")
-            output_lines.append(f"Role: {person.role}")
-            if person.contact_info:
-                output_lines.append("Contact Info:")
-                for key, value in person.contact_info.items():
-                    output_lines.append(f"  {key}: {value}")
-
-        output_lines.append("\n=== Unique Board Members ===")
-        output_lines.append("-" * 50)
-        for person in unique_board:
-            output_lines.append(f"\nName: {person.name}")
-            output_lines.append(f"Role: {person.role}")
-            if person.contact_info:
-                output_lines.append("Contact Info:")
-                for key, value in person.contact_info.items():
-                    output_lines.append(f"  {key}: {value}")
-
-        # Append final JSON output for executives.
-        output_lines.append("\n\n=== Final Executives List (JSON) ===")
-        exec_json = json.dumps(
-            [{"name": p.name, "role": p.role, "contact_info": p.contact_info} for p in unique_exec],
-            indent=2
-        )
-        output_lines.append(exec_json)
+    """Write the final analysis summary to a file, including JSON output for final lists.
 
-        # Append final JSON output for board members.
-        output_lines.append("\n\n=== Final Board Members List (JSON) ===")
-        board_json = json.dumps(
-            [{"name": p.name, "role": p.role, "contact_info": p.contact_info} for p in unique_board],
-            indent=2
-        )
-        output_lines.append(board_json)
-    else:
-        output_lines.append("No people found.")
+    Sections stream straight to the (buffered) file handle, so no
+    intermediate list of lines or full output string is ever built.
+    """
+    def write_person(f, person):
+        f.write(f"\nName: {person.name}\n")
+        f.write(f"Role: {person.role}\n")
+        if person.contact_info:
+            f.write("Contact Info:\n")
+            for key, value in person.contact_info.items():
+                f.write(f"  {key}: {value}\n")
 
-    analysis_output = "\n".join(output_lines)
     ANALYSIS_OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    ANALYSIS_OUTPUT_FILE.write_text(analysis_output, encoding="utf-8")
+    with ANALYSIS_OUTPUT_FILE.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write("Processing Summary\n")
+        f.write(HEADER_RULE + "\n")
+        f.write(f"Company: {company_name}\n")
+        f.write(f"Domain: {company_domain}\n")
+        f.write(f"Files processed: {processed_files}\n")
+        f.write(f"Total people found: {total_people}\n\n")
+
+        if exec_people or board_people:
+            # Already unique and partitioned by process_company_files.
+            unique_exec = list(exec_people.values())
+            unique_board = list(board_people.values())
+
+            f.write("=== Unique Executives/Officers ===\n")
+            f.write(SECTION_RULE + "\n")
+            for person in unique_exec:
+                write_person(f, person)
+
+            f.write("\n=== Unique Board Members ===\n")
+            f.write(SECTION_RULE + "\n")
+            for person in unique_board:
+                write_person(f, person)
+
+            # Final JSON output for executives.
+            f.write("\n\n=== Final Executives List (JSON) ===\n")
+            f.write(orjson.dumps(
+                [{"name": p.name, "role": p.role, "contact_info": p.contact_info} for p in unique_exec],
+                option=orjson.OPT_INDENT_2
+            ).decode())
+
+            # Final JSON output for board members.
+            f.write("\n\n\n=== Final Board Members List (JSON) ===\n")
+            f.write(orjson.dumps(
+                [{"name": p.name, "role": p.role, "contact_info": p.contact_info} for p in unique_board],
+                option=orjson.OPT_INDENT_2
+            ).decode())
+            f.write("\n")
+        else:
+            f.write("No people found.\n")
+
     logger.info(f"Analysis output saved to {ANALYSIS_OUTPUT_FILE}")
 
 
@@ -196,7 +261,7 @@ def main():
         company_domain = "ayagoldsilver.com"
         company_name = "Aya Gold & Silver Inc."
 
-        processed_files, total_people, company_people = process_company_files(
+        processed_files, total_people, exec_people, board_people = process_company_files(
             data_reader, company_domain, company_name
         )
 
@@ -209,10 +274,10 @@ def main():
             f"Total people found: {total_people}\n"
         )
         print(summary)
-        if company_people:
+        if exec_people or board_people:
             print("Unique People Found (Combined List)")
             print("-" * 50)
-            unique_people = {p.name: p for p in company_people}.values()
+            unique_people = {**exec_people, **board_people}.values()
             for person in unique_people:
                 print(f"\nName: {person.name}")
                 print(f"Role: {person.role}")
@@ -222,7 +287,7 @@ def main():
                         print(f"  {key}: {value}")
 
         # Save the summary analysis to a file.
-        write_analysis_output(company_name, company_domain, processed_files, total_people, company_people)
+        write_analysis_output(company_name, company_domain, processed_files, total_people, exec_people, board_people)
 
     except Exception as e:
         logger.error(f"Error in main: {str(e)}")
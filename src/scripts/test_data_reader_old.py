@@ -1,8 +1,10 @@
 """Script to test the DataReader functionality with MinIO data."""
 
+import json
 import logging
 import os
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
 from tqdm import tqdm
 
@@ -17,20 +19,27 @@ logger = logging.getLogger(__name__)
 # Constants
 MINIO_BUCKET = "min-co-web-page-data"
 
-def save_sample_content(content: str, index: int):
-    """Save sample content for manual inspection."""
+# Cap on how many per-file samples are kept for manual inspection.
+SAMPLE_LIMIT = 20
+
+def save_sample_batch(samples):
+    """Write collected samples as a single JSONL file for manual inspection."""
+    if not samples:
+        return
     output_dir = "data/test_samples"
     os.makedirs(output_dir, exist_ok=True)
-    
-    # Save summary file
-    summary_file = os.path.join(output_dir, f"sample_{index}_summary.txt")
-    with open(summary_file, "w", encoding="utf-8") as f:
-        f.write(content)
+
+    # One file with one line per sample instead of a file per sample
+    sample_file = os.path.join(output_dir, "samples.jsonl")
+    with open(sample_file, "w", encoding="utf-8") as f:
+        for index, content in samples:
+            f.write(json.dumps({"i": index, "content": content}) + "\n")
 
 def get_company_files(minio_service: MinioService, company_domain: str) -> List[str]:
     """Get all files for a specific company domain."""
-    all_files = minio_service.list_objects()
-    return [f for f in all_files if company_domain in f]
+    # The per-domain index is memoized on the service, so several
+    # companies in one run share a single bucket enumeration
+    return list(minio_service.list_objects_by_domain().get(company_domain, []))
 
 def process_company_files(data_reader: DataReader, company_domain: str, company_name: str):
     """Process all files for a specific company."""
@@ -43,43 +52,69 @@ def process_company_files(data_reader: DataReader, company_domain: str, company_
     # Process files
     processed_files = 0
     total_people = 0
+    # Deduplicate inline as people are found instead of rebuilding a dict
+    # over the full list at the end
+    seen_names = set()
     company_people = []
+    samples = []
     
-    for i, file in enumerate(tqdm(files, desc="Processing files"), 1):
+    def fetch(file):
+        try:
+            return data_reader.read_json_file(file)
+        except Exception as e:
+            logger.error(f"Error reading file {file}: {str(e)}")
+            return None
+
+    # Fetch file contents concurrently so the per-object MinIO round trips
+    # overlap instead of serializing; extraction stays sequential below
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        # Throttle the progress refresh so fast (e.g. cached) iterations
+        # don't pay a terminal update per file
+        contents = list(tqdm(pool.map(fetch, files), total=len(files),
+                             desc="Fetching files", mininterval=1.0, miniters=100))
+
+    for i, (file, content) in enumerate(zip(files, contents), 1):
         try:
-            content = data_reader.read_json_file(file)
             if not content:
                 continue
-                
+
             # Process content to extract management information
             processed_content = data_reader.process_content(content)
             if not processed_content:
                 continue
                 
-            # Save sample content
-            save_sample_content(str(processed_content), i)
+            # Collect a bounded number of samples for manual review; they are
+            # written once, after the loop, instead of one file per document.
+            if logger.isEnabledFor(logging.DEBUG) and len(samples) < SAMPLE_LIMIT:
+                samples.append((i, str(processed_content)))
             
             # Extract people
             if processed_content.people:
                 total_people += len(processed_content.people)
                 processed_files += 1
-                company_people.extend(processed_content.people)
-                
-                # Log findings
-                logger.info(f"\nFile {i}:")
-                logger.info(f"URL: {processed_content.url}")
-                logger.info(f"Title: {processed_content.title}")
-                logger.info(f"People found: {len(processed_content.people)}")
-                
                 for person in processed_content.people:
-                    logger.info(f"- {person.name} ({person.role})")
-                    if person.contact_info:
-                        logger.info(f"  Contact: {person.contact_info}")
+                    if person.name not in seen_names:
+                        seen_names.add(person.name)
+                        company_people.append(person)
+                
+                # Log findings, skipping the f-string formatting entirely
+                # when the handler level has been raised above INFO
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"\nFile {i}:")
+                    logger.info(f"URL: {processed_content.url}")
+                    logger.info(f"Title: {processed_content.title}")
+                    logger.info(f"People found: {len(processed_content.people)}")
+
+                    for person in processed_content.people:
+                        logger.info(f"- {person.name} ({person.role})")
+                        if person.contact_info:
+                            logger.info(f"  Contact: {person.contact_info}")
                 
         except Exception as e:
             logger.error(f"Error processing file {file}: {str(e)}")
             continue
     
+    save_sample_batch(samples)
     return processed_files, total_people, company_people
 
 def main():
@@ -109,8 +144,8 @@ def main():
         if company_people:
             print("\nUnique People Found")
             print("-" * 50)
-            unique_people = {p.name: p for p in company_people}.values()
-            for person in unique_people:
+            # Already deduplicated inline by process_company_files
+            for person in company_people:
                 print(f"\nName: {person.name}")
                 print(f"Role: {person.role}")
                 if person.contact_info:
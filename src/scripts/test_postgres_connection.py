@@ -1,86 +1,66 @@
 import os
 import sys
-import psycopg2
+from itertools import groupby
 from dotenv import load_dotenv
 
 # Add the project root directory to the Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 sys.path.append(project_root)
 
+from src.db.pool import pooled_connection
+
 def test_postgres_connection():
     """Test PostgreSQL connection and retrieve table information."""
     try:
         # Load environment variables
         load_dotenv()
-        
-        # Get database connection parameters
-        host = os.getenv('PG_HOST')
-        port = os.getenv('PG_PORT')
-        dbname = os.getenv('PG_DB')
-        user = os.getenv('PG_USER')
-        password = os.getenv('PG_PASS')
-        
+
         print(f"Attempting to connect to PostgreSQL database:")
-        print(f"Host: {host}")
-        print(f"Port: {port}")
-        print(f"Database: {dbname}")
-        print(f"User: {user}")
-        
-        # Establish connection
-        conn = psycopg2.connect(
-            host=host,
-            port=port,
-            dbname=dbname,
-            user=user,
-            password=password
-        )
-        
-        print("\nSuccessfully connected to PostgreSQL database!")
-        
-        # Create a cursor
-        cur = conn.cursor()
-        
-        # Get list of tables
-        cur.execute("""
-            SELECT table_name 
-            FROM information_schema.tables 
-            WHERE table_schema = 'public'
-            ORDER BY table_name;
-        """)
-        
-        tables = cur.fetchall()
-        
-        print("\nTables in the database:")
-        print("-" * 50)
-        
-        for table in tables:
-            table_name = table[0]
-            print(f"\nTable: {table_name}")
-            
-            # Get column information for each table
-            cur.execute(f"""
-                SELECT column_name, data_type, character_maximum_length
-                FROM information_schema.columns
-                WHERE table_name = '{table_name}'
-                ORDER BY ordinal_position;
-            """)
-            
-            columns = cur.fetchall()
-            print("Columns:")
-            for col in columns:
-                col_name, data_type, max_length = col
-                length_info = f" (max length: {max_length})" if max_length else ""
-                print(f"  - {col_name}: {data_type}{length_info}")
-        
-        # Close cursor and connection
-        cur.close()
-        conn.close()
-        
+        print(f"Host: {os.getenv('PG_HOST')}")
+        print(f"Port: {os.getenv('PG_PORT')}")
+        print(f"Database: {os.getenv('PG_DB')}")
+        print(f"User: {os.getenv('PG_USER')}")
+
+        # Borrow a connection from the shared pool
+        with pooled_connection() as conn:
+            _inspect_tables(conn)
+
         print("\nDatabase connection test completed successfully!")
-        
+
     except Exception as e:
         print(f"\nError: {str(e)}")
         sys.exit(1)
 
+def _inspect_tables(conn):
+    """Print every public table and its columns."""
+    print("\nSuccessfully connected to PostgreSQL database!")
+
+    # Create a cursor
+    cur = conn.cursor()
+
+    # Fetch every public table's columns in one parameterized query
+    # instead of one round trip per table
+    cur.execute("""
+        SELECT table_name, column_name, data_type, character_maximum_length
+        FROM information_schema.columns
+        WHERE table_schema = %s
+        ORDER BY table_name, ordinal_position;
+    """, ('public',))
+
+    rows = cur.fetchall()
+
+    print("\nTables in the database:")
+    print("-" * 50)
+
+    for table_name, columns in groupby(rows, key=lambda row: row[0]):
+        print(f"\nTable: {table_name}")
+        print("Columns:")
+        for _, col_name, data_type, max_length in columns:
+            length_info = f" (max length: {max_length})" if max_length else ""
+            print(f"  - {col_name}: {data_type}{length_info}")
+
+    # Close the cursor; the connection goes back to the pool
+    cur.close()
+
 if __name__ == "__main__":
     test_postgres_connection() 
\ No newline at end of file
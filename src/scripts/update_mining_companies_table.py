@@ -1,146 +1,164 @@
 import os
 import sys
-import psycopg2
-from dotenv import load_dotenv
 
 # Add the project root directory to the Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 sys.path.append(project_root)
 
+from src.db.pool import pooled_connection
+
+# Created separately from the table DDL so a bulk seed can run against the
+# bare table first; each statement runs CONCURRENTLY outside a transaction
+# block, and loads don't pay per-row index maintenance.
+INDEX_STATEMENTS = [
+    # Basic indexes
+    """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_mining_companies_name
+       ON mining_companies(company_name);""",
+    """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_mining_companies_ticker
+       ON mining_companies(ticker);""",
+    # Expression index over the normalized website so lookups hit the
+    # index regardless of scheme or trailing-slash differences; the plain
+    # btree on raw website missed on exactly those variations
+    """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_mining_companies_website_norm
+       ON mining_companies ((lower(regexp_replace(website, '^https?://|/$', '', 'g'))));""",
+    # GIN containment indexes for the JSONB arrays. officers and
+    # board_members are arrays of objects, so btree expression indexes on
+    # officers->>'name' would index NULL for every row; the searches go
+    # through @> containment instead, which these jsonb_path_ops indexes
+    # serve.
+    """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_mining_companies_officers_gin
+       ON mining_companies USING GIN (officers jsonb_path_ops);""",
+    """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_mining_companies_board_members_gin
+       ON mining_companies USING GIN (board_members jsonb_path_ops);""",
+    # GIN over the flattened officer_names array: "which companies have
+    # officer X" probes this short text[] instead of scanning JSONB
+    # payloads
+    """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_mining_companies_officer_names_gin
+       ON mining_companies USING GIN (officer_names);""",
+]
+
 def update_mining_companies_table():
     """Update mining_companies table with additional fields and JSONB columns."""
     try:
-        # Load environment variables
-        load_dotenv()
-        
-        # Get database connection parameters
-        host = os.getenv('PG_HOST')
-        port = os.getenv('PG_PORT')
-        dbname = os.getenv('PG_DB')
-        user = os.getenv('PG_USER')
-        password = os.getenv('PG_PASS')
-        
         print(f"Attempting to connect to PostgreSQL database...")
-        
-        # Establish connection
-        conn = psycopg2.connect(
-            host=host,
-            port=port,
-            dbname=dbname,
-            user=user,
-            password=password
-        )
-        
-        print("Successfully connected to PostgreSQL database!")
-        
-        # Create a cursor
-        cur = conn.cursor()
-        
-        # Drop existing table if it exists
-        cur.execute("DROP TABLE IF EXISTS mining_companies CASCADE;")
-        
-        # Create updated mining_companies table
-        cur.execute("""
-            CREATE TABLE mining_companies (
-                id SERIAL PRIMARY KEY,
-                website TEXT,
-                company_name VARCHAR(255) NOT NULL UNIQUE,
-                ticker VARCHAR(50),
-                exchange VARCHAR(50),
-                headquarters_location VARCHAR(255),
-                founded_date DATE,
-                description TEXT,
-                officers JSONB DEFAULT '[]'::jsonb,
-                board_members JSONB DEFAULT '[]'::jsonb,
-                data_source JSONB DEFAULT '{"officers": "local", "board_members": "local"}'::jsonb,
-                created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-        
-        # Create indexes for better query performance
-        cur.execute("""
-            -- Basic indexes
-            CREATE INDEX idx_mining_companies_name 
-            ON mining_companies(company_name);
-            
-            CREATE INDEX idx_mining_companies_ticker 
-            ON mining_companies(ticker);
-            
-            CREATE INDEX idx_mining_companies_website 
-            ON mining_companies(website);
-            
-            -- GIN indexes for JSONB columns
-            CREATE INDEX idx_mining_companies_officers 
-            ON mining_companies USING GIN (officers jsonb_path_ops);
-            
-            CREATE INDEX idx_mining_companies_board_members 
-            ON mining_companies USING GIN (board_members jsonb_path_ops);
-            
-            -- Expression indexes for common JSONB queries
-            CREATE INDEX idx_mining_companies_officer_names 
-            ON mining_companies USING btree ((officers->>'name'));
-            
-            CREATE INDEX idx_mining_companies_officer_titles 
-            ON mining_companies USING btree ((officers->>'title'));
-            
-            CREATE INDEX idx_mining_companies_board_names 
-            ON mining_companies USING btree ((board_members->>'name'));
-            
-            CREATE INDEX idx_mining_companies_board_titles 
-            ON mining_companies USING btree ((board_members->>'title'));
-        """)
-        
-        # Create trigger function for updating updated_at timestamp
-        cur.execute("""
-            CREATE OR REPLACE FUNCTION update_updated_at_column()
-            RETURNS TRIGGER AS $$
-            BEGIN
-                NEW.updated_at = CURRENT_TIMESTAMP;
-                RETURN NEW;
-            END;
-            $$ language 'plpgsql';
-        """)
-        
-        # Create trigger for updated_at
-        cur.execute("""
-            DROP TRIGGER IF EXISTS update_mining_companies_updated_at ON mining_companies;
-            CREATE TRIGGER update_mining_companies_updated_at
-                BEFORE UPDATE ON mining_companies
-                FOR EACH ROW
-                EXECUTE FUNCTION update_updated_at_column();
-        """)
-        
-        # Commit the transaction
-        conn.commit()
-        
-        print("\nSuccessfully updated table structure!")
-        print("\nTable structure:")
-        print("-" * 50)
-        
-        # Display table structure
-        cur.execute("""
-            SELECT column_name, data_type, character_maximum_length
-            FROM information_schema.columns
-            WHERE table_name = 'mining_companies'
-            ORDER BY ordinal_position;
-        """)
-        
-        columns = cur.fetchall()
-        for col in columns:
-            col_name, data_type, max_length = col
-            length_info = f" (max length: {max_length})" if max_length else ""
-            print(f"  - {col_name}: {data_type}{length_info}")
-        
-        # Close cursor and connection
-        cur.close()
-        conn.close()
-        
+
+        # Borrow a connection from the shared pool
+        with pooled_connection() as conn:
+            _apply_schema(conn)
+            _create_indexes(conn)
+
         print("\nDatabase table updated successfully!")
-        
+
     except Exception as e:
         print(f"\nError: {str(e)}")
         sys.exit(1)
 
+def _apply_schema(conn):
+    """Ensure the mining_companies table exists with the current columns.
+
+    Idempotent: re-running against a populated database neither drops
+    data nor rebuilds indexes, so environment bootstraps stop paying an
+    O(N log N) re-index of existing rows.
+    """
+    print("Successfully connected to PostgreSQL database!")
+
+    # Create a cursor
+    cur = conn.cursor()
+
+    # Create updated mining_companies table
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS mining_companies (
+            id SERIAL PRIMARY KEY,
+            website TEXT,
+            company_name VARCHAR(255) NOT NULL UNIQUE,
+            ticker VARCHAR(50),
+            exchange VARCHAR(50),
+            headquarters_location VARCHAR(255),
+            founded_date DATE,
+            description TEXT,
+            officers JSONB DEFAULT '[]'::jsonb,
+            board_members JSONB DEFAULT '[]'::jsonb,
+            data_source JSONB DEFAULT '{"officers": "local", "board_members": "local"}'::jsonb,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+        );
+    """)
+
+    # Migration step for databases created before the management fields
+    # existed; no-ops on an up-to-date table
+    cur.execute("""
+        ALTER TABLE mining_companies
+            ADD COLUMN IF NOT EXISTS officers JSONB DEFAULT '[]'::jsonb,
+            ADD COLUMN IF NOT EXISTS board_members JSONB DEFAULT '[]'::jsonb,
+            ADD COLUMN IF NOT EXISTS data_source JSONB DEFAULT '{"officers": "local", "board_members": "local"}'::jsonb,
+            ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+            ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP;
+    """)
+
+    # Precomputed flat array of officer names so name searches can use a
+    # GIN array index rather than probing the JSONB payloads. The helper
+    # must be declared IMMUTABLE to be usable in a generated column.
+    cur.execute("""
+        CREATE OR REPLACE FUNCTION jsonb_text_array(j JSONB, key TEXT)
+        RETURNS TEXT[] LANGUAGE sql IMMUTABLE AS $$
+            SELECT COALESCE(array_agg(elem->>key), '{}')
+            FROM jsonb_array_elements(j) AS elem
+        $$;
+
+        ALTER TABLE mining_companies
+            ADD COLUMN IF NOT EXISTS officer_names TEXT[]
+            GENERATED ALWAYS AS (jsonb_text_array(officers, 'name')) STORED;
+    """)
+
+    # No updated_at trigger: the table is update-heavy and a per-row
+    # trigger taxes every write. The service layer sets
+    # updated_at = CURRENT_TIMESTAMP in its UPDATE statements instead.
+    cur.execute("""
+        DROP TRIGGER IF EXISTS update_mining_companies_updated_at ON mining_companies;
+        DROP FUNCTION IF EXISTS update_updated_at_column() CASCADE;
+    """)
+
+    # Commit the transaction
+    conn.commit()
+
+    print("\nSuccessfully updated table structure!")
+    print("\nTable structure:")
+    print("-" * 50)
+
+    # Display table structure
+    cur.execute("""
+        SELECT column_name, data_type, character_maximum_length
+        FROM information_schema.columns
+        WHERE table_name = 'mining_companies'
+        ORDER BY ordinal_position;
+    """)
+
+    columns = cur.fetchall()
+    for col in columns:
+        col_name, data_type, max_length = col
+        length_info = f" (max length: {max_length})" if max_length else ""
+        print(f"  - {col_name}: {data_type}{length_info}")
+
+    # Close the cursor; the connection goes back to the pool
+    cur.close()
+
+def _create_indexes(conn):
+    """Create the mining_companies indexes.
+
+    Runs after the table exists (and after any bulk seed, which then
+    avoids per-row index maintenance). CREATE INDEX CONCURRENTLY cannot
+    run inside a transaction block, so the connection is flipped to
+    autocommit for the duration.
+    """
+    previous_autocommit = conn.autocommit
+    conn.autocommit = True
+    try:
+        cur = conn.cursor()
+        for statement in INDEX_STATEMENTS:
+            cur.execute(statement)
+        cur.close()
+    finally:
+        conn.autocommit = previous_autocommit
+
 if __name__ == "__main__":
-    update_mining_companies_table() 
\ No newline at end of file
+    update_mining_companies_table()
@@ -1,6 +1,7 @@
 """Script to upload sample files to MinIO bucket."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from src.services.minio_service import MinioService
 
@@ -34,20 +35,32 @@ def main():
     
     # Upload files
     print("\nUploading files to MinIO...")
-    for file_path in sample_dir.glob("*.html"):
+
+    # Precompute the name/path/metadata manifest once; the workers then
+    # only do network I/O. maxsplit=1 stops the split at the domain.
+    jobs = [(p.name, str(p), {"url": p.stem.split("_", 1)[0]})
+            for p in sample_dir.glob("*.html")]
+
+    def upload(job):
+        name, path, metadata = job
         try:
             # Upload file with metadata
             minio_service.client.fput_object(
                 "company-files",
-                file_path.name,
-                str(file_path),
+                name,
+                path,
                 content_type="text/html",
-                metadata={"url": file_path.stem.split("_")[0]}
+                metadata=metadata
             )
-            print(f"Uploaded {file_path.name}")
+            print(f"Uploaded {name}")
         except Exception as e:
-            print(f"Error uploading {file_path.name}: {e}")
-    
+            print(f"Error uploading {name}: {e}")
+
+    # Overlap the per-object upload round trips; the minio client is
+    # thread-safe for concurrent object operations
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(upload, jobs))
+
     print("\nDone!")
 
 if __name__ == "__main__":
@@ -1,75 +1,79 @@
 """Script to verify the structure of management fields in the mining_companies table."""
 
 import os
-import psycopg2
-from dotenv import load_dotenv
+import sys
+
+# Add the project root directory to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(project_root)
+
+from src.db.pool import pooled_connection
 
 def verify_management_fields():
     """Verify the structure of management fields in the mining_companies table."""
-    # Load environment variables
-    load_dotenv()
-    
-    # Get database connection parameters
-    db_params = {
-        'dbname': os.getenv('PG_DB'),
-        'user': os.getenv('PG_USER'),
-        'password': os.getenv('PG_PASS'),
-        'host': os.getenv('PG_HOST'),
-        'port': os.getenv('PG_PORT')
-    }
-    
-    # Connect to database
-    conn = psycopg2.connect(**db_params)
+    # Borrow a connection from the shared pool instead of opening one per run
+    with pooled_connection() as conn:
+        _verify(conn)
+
+def _verify(conn):
+    """Print management column types, indexes and a sample row."""
     cur = conn.cursor()
-    
+
     try:
-        # Check column types
+        # One CTE-based query fetches column types, indexes and the sample
+        # row together — a single round trip instead of three
         cur.execute("""
-            SELECT column_name, data_type, column_default
-            FROM information_schema.columns
-            WHERE table_name = 'mining_companies'
-            AND column_name IN ('officers', 'board_members', 'data_source');
+            WITH cols AS (
+                SELECT column_name, data_type, column_default
+                FROM information_schema.columns
+                WHERE table_name = 'mining_companies'
+                AND column_name IN ('officers', 'board_members', 'data_source')
+            ), idx AS (
+                SELECT indexname, indexdef
+                FROM pg_indexes
+                WHERE tablename = 'mining_companies'
+                AND indexname LIKE 'idx_mining_companies_%'
+            ), sample AS (
+                SELECT company_name, officers, board_members, data_source
+                FROM mining_companies
+                LIMIT 1
+            )
+            SELECT 'col' AS kind, column_name::text, data_type::text,
+                   column_default::text, NULL::text
+            FROM cols
+            UNION ALL
+            SELECT 'idx', indexname, indexdef, NULL, NULL FROM idx
+            UNION ALL
+            SELECT 'sample', company_name, officers::text,
+                   board_members::text, data_source::text
+            FROM sample;
         """)
-        
+
+        rows = cur.fetchall()
+
         print("\nManagement field types:")
-        for row in cur.fetchall():
-            print(f"\nField: {row[0]}")
-            print(f"Type: {row[1]}")
-            print(f"Default: {row[2]}")
-        
-        # Check indexes
-        cur.execute("""
-            SELECT indexname, indexdef
-            FROM pg_indexes
-            WHERE tablename = 'mining_companies'
-            AND indexname LIKE 'idx_mining_companies_%';
-        """)
-        
+        for _, name, data_type, default, _ in (r for r in rows if r[0] == 'col'):
+            print(f"\nField: {name}")
+            print(f"Type: {data_type}")
+            print(f"Default: {default}")
+
         print("\nManagement field indexes:")
-        for row in cur.fetchall():
-            print(f"\nIndex: {row[0]}")
-            print(f"Definition: {row[1]}")
-        
-        # Get sample data
+        for _, name, definition, _, _ in (r for r in rows if r[0] == 'idx'):
+            print(f"\nIndex: {name}")
+            print(f"Definition: {definition}")
+
         print("\nSample data from first company:")
-        cur.execute("""
-            SELECT company_name, officers, board_members, data_source
-            FROM mining_companies
-            LIMIT 1;
-        """)
-        
-        row = cur.fetchone()
-        if row:
-            print(f"\nCompany: {row[0]}")
-            print(f"Officers: {row[1]}")
-            print(f"Board Members: {row[2]}")
-            print(f"Data Source: {row[3]}")
-            
+        for _, company, officers, board_members, data_source in (r for r in rows if r[0] == 'sample'):
+            print(f"\nCompany: {company}")
+            print(f"Officers: {officers}")
+            print(f"Board Members: {board_members}")
+            print(f"Data Source: {data_source}")
+
     except Exception as e:
         print(f"Error verifying management fields: {str(e)}")
     finally:
+        # Close the cursor; the connection goes back to the pool
         cur.close()
-        conn.close()
 
 if __name__ == "__main__":
     verify_management_fields() 
\ No newline at end of file
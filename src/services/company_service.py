@@ -1,31 +1,227 @@
 """Service for managing company operations."""
 
-from typing import List, Optional, Dict, Any
+import io
+import re
+import sys
+import time
+
+import pandas as pd
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Tuple
+from psycopg2.extras import RealDictCursor
 from src.models.company import Company
 from src.services.db_service import DatabaseService
 from src.services.llm_service import LLMService
 import json
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=4096)
+def _fold(value: str) -> str:
+    """Casefold a lookup key, memoized for repeated queries.
+
+    casefold (not lower) so Unicode names compare correctly, and the
+    cache skips the folding work when pipelines re-query the same
+    handful of names/tickers.
+    """
+    return value.casefold()
+
 class CompanyService:
     """Service for managing company operations."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Optional[Dict[str, Any]] = None,
+                 companies_file: Optional[Path] = None):
         """Initialize the company service.
-        
+
         Args:
             config: Configuration dictionary containing service settings
+            companies_file: CSV file of companies; when given the service
+                runs file-backed (no database or LLM) and serves lookups
+                from hash indexes built on first access
+        """
+        self.companies_file = Path(companies_file) if companies_file else None
+        if self.companies_file is None:
+            self.db_service = DatabaseService(config)
+            self.llm_service = LLMService(config)
+        else:
+            self.db_service = None
+            self.llm_service = None
+        # CSV lookup indexes, built lazily in one pass so every
+        # get_company_by_* is a dict hit instead of an O(N) scan
+        self._by_url: Optional[Dict[str, Company]] = None
+        self._by_name_lower: Dict[str, Company] = {}
+        self._by_ticker_lower: Dict[str, Company] = {}
+        self._by_exchange: Dict[str, List[Company]] = {}
+        # Bounded LRU over name/website lookups: enrichment pipelines hit
+        # the same companies repeatedly, and a hit skips the round trip
+        self._lookup_cache: OrderedDict = OrderedDict()
+
+    _LOOKUP_CACHE_SIZE = 4096
+    # Entries also age out so long-running batch jobs never serve
+    # arbitrarily stale rows even without an intervening update
+    _LOOKUP_CACHE_TTL = 300
+
+    def _cache_lookup(self, key) -> Optional[Company]:
+        """Return a fresh cached company and mark it most recently used."""
+        try:
+            company, stored_at = self._lookup_cache.pop(key)
+        except KeyError:
+            return None
+        if time.monotonic() - stored_at > self._LOOKUP_CACHE_TTL:
+            return None
+        self._lookup_cache[key] = (company, stored_at)
+        return company
+
+    def _cache_store(self, key, company: Company) -> None:
+        """Cache a lookup hit, evicting the least recently used entry."""
+        self._lookup_cache[key] = (company, time.monotonic())
+        if len(self._lookup_cache) > self._LOOKUP_CACHE_SIZE:
+            self._lookup_cache.popitem(last=False)
+
+    def _cache_invalidate(self, company_id: int) -> None:
+        """Drop cached entries for a company after it is updated."""
+        stale = [key for key, (company, _) in self._lookup_cache.items()
+                 if company.id == company_id]
+        for key in stale:
+            del self._lookup_cache[key]
+
+    def _ensure_indexes(self) -> None:
+        """Build the CSV lookup indexes if they are not built yet.
+
+        One pass over the parsed file fills all four indexes, so the
+        file is read once per service no matter how many lookups follow.
+        """
+        if self._by_url is not None:
+            return
+        by_url: Dict[str, Company] = {}
+        # pandas' C parser scans the file in bulk; itertuples hands back
+        # plain tuples, so the per-row Python work is just the Company
+        # construction and index inserts
+        df = pd.read_csv(
+            self.companies_file,
+            usecols=['URL', 'Name', 'Exchange', 'Ticker'],
+            dtype=str,
+            keep_default_na=False
+        )
+        for url, name, exchange, ticker in df[['URL', 'Name', 'Exchange', 'Ticker']].itertuples(index=False, name=None):
+            company = Company(
+                id=None,
+                website=url,
+                company_name=name,
+                ticker=ticker or None,
+                # The exchange column has a handful of distinct values
+                # repeated across every row; interning collapses the
+                # duplicates to one object each and turns the equality
+                # checks in get_companies_by_exchange into pointer
+                # compares
+                exchange=sys.intern(exchange) if exchange else None,
+                headquarters_location=None,
+                founded_date=None,
+                description=None,
+                officers=[],
+                board_members=[],
+                data_source={}
+            )
+            by_url[company.website] = company
+            self._by_name_lower[company.company_name.casefold()] = company
+            if company.ticker:
+                self._by_ticker_lower[company.ticker.casefold()] = company
+            if company.exchange:
+                self._by_exchange.setdefault(company.exchange, []).append(company)
+        self._by_url = by_url
+
+    def load_companies(self) -> List[Company]:
+        """Load companies from the CSV file.
+
+        Returns:
+            List of Company instances in file order
+        """
+        self._ensure_indexes()
+        return list(self._by_url.values())
+
+    def get_company_by_url(self, url: str) -> Optional[Company]:
+        """Get a company by URL from the CSV indexes.
+
+        Args:
+            url: Company website URL
+
+        Returns:
+            Company instance if found, None otherwise
+        """
+        self._ensure_indexes()
+        return self._by_url.get(url)
+
+    def get_company_by_ticker(self, ticker: str) -> Optional[Company]:
+        """Get a company by ticker symbol (case-insensitive).
+
+        Args:
+            ticker: Ticker symbol to search for
+
+        Returns:
+            Company instance if found, None otherwise
         """
-        self.db_service = DatabaseService(config)
-        self.llm_service = LLMService(config)
+        self._ensure_indexes()
+        return self._by_ticker_lower.get(_fold(ticker))
+
+    def get_companies_by_exchange(self, exchange: str) -> List[Company]:
+        """Get all companies listed on an exchange.
+
+        Args:
+            exchange: Exchange name to search for
+
+        Returns:
+            List of Company instances, empty if none match
+        """
+        self._ensure_indexes()
+        return list(self._by_exchange.get(exchange, []))
+
+    def get_companies_dict(self) -> Dict[str, Company]:
+        """Get all companies keyed by URL.
+
+        Returns:
+            Dictionary mapping website URL to Company
+        """
+        self._ensure_indexes()
+        return dict(self._by_url)
+
+    @staticmethod
+    def _normalize_website(website: str) -> str:
+        """Normalize scheme and trailing slashes out of a website key."""
+        return re.sub(r'^https?://|/+$', '', website.strip().lower())
+
+    def _require_db(self) -> None:
+        """Raise if this service was built file-backed (no database).
+
+        A bare AttributeError off the None db_service would be opaque;
+        this names the seam instead.
+        """
+        if self.db_service is None:
+            raise RuntimeError(
+                "CompanyService was created with companies_file; "
+                "database-backed operations are unavailable"
+            )
     
-    def get_all_companies(self) -> List[Company]:
-        """Get all companies from the database."""
+    def get_all_companies(self):
+        """Stream all companies from the database.
+
+        Uses a named (server-side) cursor so rows arrive in itersize
+        batches and the full result set — large JSONB payloads included —
+        is never materialized on the client. RealDictCursor yields dicts
+        straight off the driver's row buffer, keeping Company.from_dict
+        the single canonical construction path.
+
+        Yields:
+            Company instances in company_name order
+        """
+        self._require_db()
         try:
             with self.db_service.get_connection() as conn:
-                with conn.cursor() as cur:
+                with conn.cursor(name='companies_stream', cursor_factory=RealDictCursor) as cur:
+                    cur.itersize = 500
                     cur.execute("""
                         SELECT id, website, company_name, ticker, exchange,
                                headquarters_location, founded_date, description,
@@ -33,11 +229,18 @@ class CompanyService:
                         FROM mining_companies
                         ORDER BY company_name
                     """)
-                    rows = cur.fetchall()
-                    return [Company(*row) for row in rows]
+                    for row in cur:
+                        yield Company.from_dict(row)
         except Exception as e:
             logger.error(f"Error getting companies: {str(e)}")
-            return []
+
+    def get_all_companies_list(self) -> List[Company]:
+        """Get all companies materialized as a list.
+
+        Only for callers that genuinely need random access; iteration
+        should prefer get_all_companies.
+        """
+        return list(self.get_all_companies())
     
     def get_company_by_name(self, name: str) -> Optional[Company]:
         """Get a company by name.
@@ -48,8 +251,19 @@ class CompanyService:
         Returns:
             Company instance if found, None otherwise
         """
+        if self.companies_file is not None:
+            self._ensure_indexes()
+            return self._by_name_lower.get(_fold(name.strip()))
+        key = ('name', name.strip().lower())
+        company = self._cache_lookup(key)
+        if company is not None:
+            return company
         company_data = self.db_service.get_company_by_name(name)
-        return Company.from_dict(company_data) if company_data else None
+        if not company_data:
+            return None
+        company = Company.from_dict(company_data)
+        self._cache_store(key, company)
+        return company
     
     def get_company_by_website(self, website: str) -> Optional[Company]:
         """Get a company by website URL.
@@ -60,8 +274,20 @@ class CompanyService:
         Returns:
             Company instance if found, None otherwise
         """
+        if self.companies_file is not None:
+            # File-backed: the URL index answers this without a database
+            self._ensure_indexes()
+            return self._by_url.get(website)
+        key = ('website', self._normalize_website(website))
+        company = self._cache_lookup(key)
+        if company is not None:
+            return company
         company_data = self.db_service.get_company_by_website(website)
-        return Company.from_dict(company_data) if company_data else None
+        if not company_data:
+            return None
+        company = Company.from_dict(company_data)
+        self._cache_store(key, company)
+        return company
     
     def update_company_management(self, company_id: int, 
                                 officers: List[Dict[str, str]], 
@@ -78,6 +304,8 @@ class CompanyService:
         Returns:
             True if successful, False otherwise
         """
+        self._require_db()
+        self._cache_invalidate(company_id)
         return self.db_service.update_company_management(
             company_id=company_id,
             officers=officers,
@@ -98,6 +326,8 @@ class CompanyService:
         Returns:
             True if successful, False otherwise
         """
+        self._require_db()
+        self._cache_invalidate(company_id)
         return self.db_service.update_company_officers(
             company_id=company_id,
             officers=officers,
@@ -117,12 +347,101 @@ class CompanyService:
         Returns:
             True if successful, False otherwise
         """
+        self._require_db()
+        self._cache_invalidate(company_id)
         return self.db_service.update_company_board(
             company_id=company_id,
             board_members=board_members,
             source=source
         )
     
+    def bulk_update_management_batched(self, rows: List[Tuple[int, list, list, dict]]) -> bool:
+        """Update management for a medium-sized batch of companies.
+
+        Delegates to the execute_values-based db_service path; for very
+        large refreshes prefer bulk_update_management, which stages via
+        COPY.
+
+        Args:
+            rows: List of (company_id, officers, board_members, data_source)
+                tuples
+
+        Returns:
+            True if successful, False otherwise
+        """
+        self._require_db()
+        return self.db_service.bulk_update_company_management(rows)
+
+    def bulk_update_management(self, rows: List[Tuple[int, list, list, dict]]) -> bool:
+        """Bulk-refresh management information for many companies at once.
+
+        Stages all rows into a temp table with a single COPY FROM STDIN,
+        then applies one UPDATE ... FROM, so a refresh of N companies
+        costs two statements instead of N per-row updates.
+
+        Args:
+            rows: List of (company_id, officers, board_members, data_source)
+                tuples
+
+        Returns:
+            True if successful, False otherwise
+        """
+        self._require_db()
+        if not rows:
+            return True
+
+        def escape(value) -> str:
+            # COPY text format: backslashes must be doubled so the JSON
+            # escape sequences survive the load
+            return json.dumps(value).replace('\\', '\\\\')
+
+        try:
+            buffer = io.StringIO()
+            for company_id, officers, board_members, data_source in rows:
+                buffer.write('\t'.join([
+                    str(company_id),
+                    escape(officers),
+                    escape(board_members),
+                    escape(data_source)
+                ]) + '\n')
+            buffer.seek(0)
+
+            with self.db_service.get_connection() as conn:
+                with conn.cursor() as cur:
+                    # The staged UPDATE is trivially planned; JIT would
+                    # only add compile time
+                    cur.execute("SET LOCAL jit = off;")
+                    cur.execute("""
+                        CREATE TEMP TABLE _management_stage (
+                            id INTEGER,
+                            officers JSONB,
+                            board_members JSONB,
+                            data_source JSONB
+                        ) ON COMMIT DROP;
+                    """)
+                    # FREEZE is valid because the stage table was created
+                    # in this same transaction; it skips the WAL and
+                    # visibility-hint work on every staged row
+                    cur.copy_expert(
+                        "COPY _management_stage (id, officers, board_members, data_source) "
+                        "FROM STDIN WITH (FREEZE)",
+                        buffer
+                    )
+                    cur.execute("""
+                        UPDATE mining_companies AS m
+                        SET officers = s.officers,
+                            board_members = s.board_members,
+                            data_source = s.data_source,
+                            updated_at = CURRENT_TIMESTAMP
+                        FROM _management_stage AS s
+                        WHERE m.id = s.id;
+                    """)
+                    conn.commit()
+                    return True
+        except Exception as e:
+            logger.error(f"Error bulk updating management: {str(e)}")
+            return False
+
     def search_companies_by_officer(self, name: str) -> List[Company]:
         """Search for companies by officer name.
         
@@ -132,6 +451,7 @@ class CompanyService:
         Returns:
             List of Company instances where the officer was found
         """
+        self._require_db()
         companies_data = self.db_service.search_companies_by_officer(name)
         return [Company.from_dict(data) for data in companies_data]
     
@@ -144,6 +464,7 @@ class CompanyService:
         Returns:
             List of Company instances where the role was found
         """
+        self._require_db()
         companies_data = self.db_service.search_companies_by_role(role)
         return [Company.from_dict(data) for data in companies_data]
     
@@ -153,6 +474,7 @@ class CompanyService:
         Returns:
             List of dictionaries containing company and officer information
         """
+        self._require_db()
         return self.db_service.get_all_officers()
     
     def get_all_board_members(self) -> List[Dict[str, Any]]:
@@ -161,20 +483,5 @@ class CompanyService:
         Returns:
             List of dictionaries containing company and board member information
         """
-        return self.db_service.get_all_board_members()
-    
-    def update_data_source(self, company_id: int, data_source: dict) -> bool:
-        """Update the data source for a company's management information."""
-        try:
-            with self.db_service.get_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        UPDATE mining_companies 
-                        SET data_source = %s::jsonb 
-                        WHERE id = %s
-                    """, (json.dumps(data_source), company_id))
-                    conn.commit()
-                    return True
-        except Exception as e:
-            logger.error(f"Error updating data source for company {company_id}: {str(e)}")
-            return False 
\ No newline at end of file
+        self._require_db()
+        return self.db_service.get_all_board_members() 
\ No newline at end of file
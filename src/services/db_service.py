@@ -1,16 +1,74 @@
 """Service for managing database operations."""
 
+import json
+import logging
 import os
-from typing import List, Optional, Dict, Any
+import re
+import weakref
+from contextlib import contextmanager
+from typing import List, Optional, Dict, Any, Tuple
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import Json, RealDictCursor, execute_values, register_default_jsonb
+from psycopg2.pool import ThreadedConnectionPool
 from dotenv import load_dotenv
 
 from src.models.company import Company
 
+logger = logging.getLogger(__name__)
+
+# Python-side mirror of the SQL normalization used by the website
+# lookups: scheme and trailing slash stripped, lowercased
+_WEBSITE_NORM_RE = re.compile(r'^https?://|/$')
+
+# Let the driver serialize/deserialize jsonb itself: writes pass dicts and
+# lists wrapped in Json, reads come back as Python objects, with no
+# json.dumps string round trip on our side
+register_default_jsonb(globally=True, loads=json.loads)
+
 class DatabaseService:
     """Service for managing database operations."""
-    
+
+    # Hot single-row statements prepared once per pooled connection:
+    # EXECUTE skips the server-side parse/plan that otherwise repeats on
+    # every call, which is a real fraction of sub-millisecond queries
+    _PREPARED_STATEMENTS = {
+        'get_co_by_name': """
+            SELECT id, website, company_name, ticker, exchange,
+                   headquarters_location, founded_date, description,
+                   officers, board_members, data_source
+            FROM mining_companies
+            WHERE company_name = $1
+        """,
+        'get_co_by_website': """
+            SELECT id, website, company_name, ticker, exchange,
+                   headquarters_location, founded_date, description,
+                   officers, board_members, data_source
+            FROM mining_companies
+            WHERE lower(regexp_replace(website, '^https?://|/$', '', 'g')) =
+                  lower(regexp_replace($1, '^https?://|/$', '', 'g'))
+        """,
+        'update_co_officers': """
+            UPDATE mining_companies
+            SET officers = $1,
+                data_source = jsonb_set(
+                    COALESCE(data_source, '{}'::jsonb),
+                    '{officers}', to_jsonb($2::text)
+                ),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = $3
+        """,
+        'update_co_board': """
+            UPDATE mining_companies
+            SET board_members = $1,
+                data_source = jsonb_set(
+                    COALESCE(data_source, '{}'::jsonb),
+                    '{board_members}', to_jsonb($2::text)
+                ),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = $3
+        """,
+    }
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize the database service.
         
@@ -23,29 +81,79 @@ class DatabaseService:
         self.dbname = config['db_name']
         self.user = config['db_user']
         self.password = config['db_password']
+        self.pool_size = config.get('db_pool_size', 20)
         
         # Validate required configuration
         if not all([self.host, self.port, self.dbname, self.user, self.password]):
             raise ValueError("Missing required database configuration parameters")
-        
+
+        # Created lazily so constructing the service never opens a
+        # connection; once built, every call reuses an authenticated
+        # connection instead of paying the TCP+auth handshake per call
+        self._pool: Optional[ThreadedConnectionPool] = None
+        # Connections whose session already has the prepared statements
+        # above. A WeakSet holds the connection objects themselves: when
+        # the pool discards a broken connection the entry disappears with
+        # it, so a replacement is re-prepared instead of inheriting a
+        # stale id the way an id()-keyed set would
+        self._prepared_conns: "weakref.WeakSet" = weakref.WeakSet()
+
+    @contextmanager
     def get_connection(self):
-        """Get a database connection."""
-        return psycopg2.connect(
-            host=self.host,
-            port=self.port,
-            dbname=self.dbname,
-            user=self.user,
-            password=self.password
-        )
-        
-    def get_all_companies(self) -> List[Dict[str, Any]]:
-        """Get all companies from the database.
-        
-        Returns:
-            List of company dictionaries
+        """Borrow a database connection from the pool.
+
+        Yields the connection inside its transaction context manager, so
+        commit/rollback-on-exit behaves like the previous per-call
+        connections; the connection itself goes back to the pool instead
+        of being closed.
+        """
+        if self._pool is None:
+            self._pool = ThreadedConnectionPool(
+                minconn=2,
+                maxconn=self.pool_size,
+                host=self.host,
+                port=self.port,
+                dbname=self.dbname,
+                user=self.user,
+                password=self.password
+            )
+        conn = self._pool.getconn()
+        try:
+            if conn not in self._prepared_conns:
+                # Prepared in (and committed by) their own transaction so a
+                # later rollback on this connection can't unprepare them
+                with conn:
+                    with conn.cursor() as cur:
+                        for stmt_name, sql in self._PREPARED_STATEMENTS.items():
+                            cur.execute(f"PREPARE {stmt_name} AS {sql}")
+                self._prepared_conns.add(conn)
+            with conn:
+                yield conn
+        finally:
+            self._pool.putconn(conn)
+
+    def close(self) -> None:
+        """Close every pooled connection (for shutdown/teardown)."""
+        if self._pool is not None:
+            self._pool.closeall()
+            self._pool = None
+            self._prepared_conns.clear()
+
+
+    def get_all_companies(self):
+        """Stream all companies from the database.
+
+        A named (server-side) cursor fetches itersize rows at a time, so
+        client memory stays bounded and the first row arrives after one
+        batch instead of after the whole table. Callers that need random
+        access wrap the result in list().
+
+        Yields:
+            Company dictionaries in company_name order
         """
         with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            with conn.cursor(name='all_companies', cursor_factory=RealDictCursor) as cur:
+                cur.itersize = 1000
                 cur.execute("""
                     SELECT id, website, company_name, ticker, exchange,
                            headquarters_location, founded_date, description,
@@ -53,8 +161,37 @@ class DatabaseService:
                     FROM mining_companies
                     ORDER BY company_name;
                 """)
-                return cur.fetchall()
+                for row in cur:
+                    yield row
     
+    def iter_company_batches(self, batch_size: int = 1000):
+        """Stream all companies from the database in batches.
+
+        Uses a named (server-side) cursor so the full result set is never
+        materialized on the client; rows are pulled batch_size at a time.
+
+        Args:
+            batch_size: Number of rows to fetch per round trip
+
+        Yields:
+            Lists of up to batch_size company dictionaries
+        """
+        with self.get_connection() as conn:
+            with conn.cursor(name='all_companies_cursor', cursor_factory=RealDictCursor) as cur:
+                cur.itersize = batch_size
+                cur.execute("""
+                    SELECT id, website, company_name, ticker, exchange,
+                           headquarters_location, founded_date, description,
+                           officers, board_members, data_source
+                    FROM mining_companies
+                    ORDER BY company_name;
+                """)
+                while True:
+                    batch = cur.fetchmany(batch_size)
+                    if not batch:
+                        break
+                    yield batch
+
     def get_company_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Get a company by name.
         
@@ -66,13 +203,7 @@ class DatabaseService:
         """
         with self.get_connection() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute("""
-                    SELECT id, website, company_name, ticker, exchange,
-                           headquarters_location, founded_date, description,
-                           officers, board_members, data_source
-                    FROM mining_companies
-                    WHERE company_name = %s;
-                """, (name,))
+                cur.execute("EXECUTE get_co_by_name(%s);", (name,))
                 return cur.fetchone()
     
     def get_company_by_website(self, website: str) -> Optional[Dict[str, Any]]:
@@ -84,18 +215,181 @@ class DatabaseService:
         Returns:
             Company dictionary if found, None otherwise
         """
+        with self.get_connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute("EXECUTE get_co_by_website(%s);", (website,))
+                return cur.fetchone()
+    
+    def get_companies_by_websites(self, websites: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get companies for several website URLs in a single query.
+
+        Replaces one get_company_by_website round trip per domain with a
+        single ANY(%s) lookup.
+
+        Args:
+            websites: Website URLs to look up
+
+        Returns:
+            Dictionary mapping each input website to its company
+            dictionary (inputs without a match are absent)
+        """
+        if not websites:
+            return {}
+        # Normalize both sides the same way the get_co_by_website
+        # prepared statement does: callers pass bare domains while stored
+        # websites carry a scheme (and sometimes a trailing slash), so
+        # raw equality never matches
+        keys = {website: _WEBSITE_NORM_RE.sub('', website.strip()).lower()
+                for website in websites}
         with self.get_connection() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
                 cur.execute("""
                     SELECT id, website, company_name, ticker, exchange,
                            headquarters_location, founded_date, description,
-                           officers, board_members, data_source
+                           officers, board_members, data_source,
+                           lower(regexp_replace(website, '^https?://|/$', '', 'g'))
+                               AS website_key
                     FROM mining_companies
-                    WHERE website = %s;
-                """, (website,))
-                return cur.fetchone()
-    
-    def update_company_management(self, company_id: int, 
+                    WHERE lower(regexp_replace(website, '^https?://|/$', '', 'g')) =
+                          ANY(%s);
+                """, (list(set(keys.values())),))
+                by_key = {row.pop('website_key'): row for row in cur.fetchall()}
+        # Key the result by the caller's own values so lookups like
+        # companies.get(domain) hit regardless of how the DB stores the URL
+        return {website: by_key[key]
+                for website, key in keys.items() if key in by_key}
+
+    def bulk_update_company_officers(self, updates: List[Tuple[int, List[Dict[str, str]]]],
+                                     source: str) -> bool:
+        """Update officers for many companies in one statement.
+
+        Batches all (company_id, officers) pairs through a single
+        execute_values UPDATE ... FROM (VALUES ...) instead of issuing one
+        update per company. Loops that call update_company_officers per
+        company are round-trip-bound and should collect their pairs and
+        call this instead — a 1000-company refresh costs ~1 round trip
+        rather than 1000.
+
+        Args:
+            updates: List of (company_id, officers list) tuples
+            source: Source of the data ('local' or 'llm')
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not updates:
+            return True
+        try:
+            rows = [(company_id, Json(officers), f'"{source}"')
+                    for company_id, officers in updates]
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    # These statements are trivially planned; skipping JIT
+                    # avoids its compile cost (and pathological plans) on
+                    # large VALUES lists
+                    cur.execute("SET LOCAL jit = off;")
+                    execute_values(cur, """
+                        UPDATE mining_companies AS c
+                        SET officers = v.officers::jsonb,
+                            data_source = jsonb_set(c.data_source, '{officers}', v.source::jsonb),
+                            updated_at = CURRENT_TIMESTAMP
+                        FROM (VALUES %s) AS v(id, officers, source)
+                        WHERE c.id = v.id;
+                    """, rows, page_size=1000)
+                    return True
+        except Exception as e:
+            logger.error("Error bulk updating company officers: %s", e)
+            return False
+
+    def bulk_update_company_management(
+            self, rows: List[Tuple[int, List[Dict[str, str]], List[Dict[str, str]], Dict[str, str]]]
+    ) -> bool:
+        """Update management information for many companies in one statement.
+
+        Medium-batch counterpart to the COPY-staged path: execute_values
+        folds every row into a single UPDATE ... FROM (VALUES ...), the
+        sweet spot between executemany and COPY for a few hundred rows.
+
+        Args:
+            rows: List of (company_id, officers, board_members, data_source)
+                tuples
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not rows:
+            return True
+        try:
+            values = [(company_id, Json(officers), Json(board_members), Json(data_source))
+                      for company_id, officers, board_members, data_source in rows]
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    # These statements are trivially planned; skipping JIT
+                    # avoids its compile cost (and pathological plans) on
+                    # large VALUES lists
+                    cur.execute("SET LOCAL jit = off;")
+                    execute_values(cur, """
+                        UPDATE mining_companies AS m
+                        SET officers = v.officers::jsonb,
+                            board_members = v.board_members::jsonb,
+                            data_source = v.data_source::jsonb,
+                            updated_at = CURRENT_TIMESTAMP
+                        FROM (VALUES %s) AS v(id, officers, board_members, data_source)
+                        WHERE m.id = v.id;
+                    """, values, template="(%s, %s::jsonb, %s::jsonb, %s::jsonb)", page_size=500)
+                    return True
+        except Exception as e:
+            logger.error("Error bulk updating company management: %s", e)
+            return False
+
+    def bulk_update_company_management_source(
+            self, rows: List[Tuple[int, List[Dict[str, str]], List[Dict[str, str]], str]]
+    ) -> bool:
+        """Update officers and board for many companies, tagging the source.
+
+        Like bulk_update_company_management, but takes a source label per
+        row and merges it into data_source with jsonb_set — preserving any
+        other keys — instead of replacing the whole document.
+
+        Args:
+            rows: List of (company_id, officers, board_members, source)
+                tuples
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not rows:
+            return True
+        try:
+            values = [(company_id, Json(officers), Json(board_members), source)
+                      for company_id, officers, board_members, source in rows]
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    # These statements are trivially planned; skipping JIT
+                    # avoids its compile cost (and pathological plans) on
+                    # large VALUES lists
+                    cur.execute("SET LOCAL jit = off;")
+                    execute_values(cur, """
+                        UPDATE mining_companies AS m
+                        SET officers = v.officers::jsonb,
+                            board_members = v.board_members::jsonb,
+                            data_source = jsonb_set(
+                                jsonb_set(
+                                    COALESCE(m.data_source, '{}'::jsonb),
+                                    '{officers}', to_jsonb(v.source)
+                                ),
+                                '{board_members}', to_jsonb(v.source)
+                            ),
+                            updated_at = CURRENT_TIMESTAMP
+                        FROM (VALUES %s) AS v(id, officers, board_members, source)
+                        WHERE m.id = v.id;
+                    """, values, template="(%s, %s::jsonb, %s::jsonb, %s::text)", page_size=500)
+                    return True
+        except Exception as e:
+            logger.error("Error bulk updating company management source: %s", e)
+            return False
+
+    def update_company_management(self, company_id: int,
                                 officers: List[Dict[str, str]], 
                                 board_members: List[Dict[str, str]],
                                 source: str) -> bool:
@@ -113,37 +407,26 @@ class DatabaseService:
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
-                    # Update data source
+                    # One statement updates content and data source
+                    # together: a single round trip per refresh instead of
+                    # three
                     cur.execute("""
                         UPDATE mining_companies
-                        SET data_source = jsonb_set(
-                            data_source,
-                            '{officers}',
-                            %s::jsonb
-                        )
+                        SET officers = %s,
+                            board_members = %s,
+                            data_source = jsonb_set(
+                                jsonb_set(
+                                    COALESCE(data_source, '{}'::jsonb),
+                                    '{officers}', to_jsonb(%s::text)
+                                ),
+                                '{board_members}', to_jsonb(%s::text)
+                            ),
+                            updated_at = CURRENT_TIMESTAMP
                         WHERE id = %s;
-                    """, (f'"{source}"', company_id))
-                    
-                    cur.execute("""
-                        UPDATE mining_companies
-                        SET data_source = jsonb_set(
-                            data_source,
-                            '{board_members}',
-                            %s::jsonb
-                        )
-                        WHERE id = %s;
-                    """, (f'"{source}"', company_id))
-                    
-                    # Update officers and board members
-                    cur.execute("""
-                        UPDATE mining_companies
-                        SET officers = %s::jsonb,
-                            board_members = %s::jsonb
-                        WHERE id = %s;
-                    """, (officers, board_members, company_id))
+                    """, (Json(officers), Json(board_members), source, source, company_id))
                     return True
         except Exception as e:
-            print(f"Error updating company management: {str(e)}")
+            logger.error("Error updating company management: %s", e)
             return False
     
     def update_company_officers(self, company_id: int, officers: List[Dict[str, str]], source: str) -> bool:
@@ -160,26 +443,13 @@ class DatabaseService:
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
-                    # Update data source
-                    cur.execute("""
-                        UPDATE mining_companies
-                        SET data_source = jsonb_set(
-                            data_source,
-                            '{officers}',
-                            %s::jsonb
-                        )
-                        WHERE id = %s;
-                    """, (f'"{source}"', company_id))
-                    
-                    # Update officers
-                    cur.execute("""
-                        UPDATE mining_companies
-                        SET officers = %s::jsonb
-                        WHERE id = %s;
-                    """, (officers, company_id))
+                    # One prepared statement updates officers and data
+                    # source together: a single round trip, no re-plan
+                    cur.execute("EXECUTE update_co_officers(%s, %s, %s);",
+                                (Json(officers), source, company_id))
                     return True
         except Exception as e:
-            print(f"Error updating company officers: {str(e)}")
+            logger.error("Error updating company officers: %s", e)
             return False
     
     def update_company_board(self, company_id: int, board_members: List[Dict[str, str]], source: str) -> bool:
@@ -196,26 +466,13 @@ class DatabaseService:
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
-                    # Update data source
-                    cur.execute("""
-                        UPDATE mining_companies
-                        SET data_source = jsonb_set(
-                            data_source,
-                            '{board_members}',
-                            %s::jsonb
-                        )
-                        WHERE id = %s;
-                    """, (f'"{source}"', company_id))
-                    
-                    # Update board members
-                    cur.execute("""
-                        UPDATE mining_companies
-                        SET board_members = %s::jsonb
-                        WHERE id = %s;
-                    """, (board_members, company_id))
+                    # One prepared statement updates board members and data
+                    # source together: a single round trip, no re-plan
+                    cur.execute("EXECUTE update_co_board(%s, %s, %s);",
+                                (Json(board_members), source, company_id))
                     return True
         except Exception as e:
-            print(f"Error updating company board members: {str(e)}")
+            logger.error("Error updating company board members: %s", e)
             return False
     
     def search_companies_by_officer(self, name: str) -> List[Dict[str, Any]]:
@@ -234,7 +491,7 @@ class DatabaseService:
                            headquarters_location, founded_date, description,
                            officers, board_members, data_source
                     FROM mining_companies
-                    WHERE officers @> '[{"name": %s}]'::jsonb
+                    WHERE officer_names @> ARRAY[%s]
                     ORDER BY company_name;
                 """, (name,))
                 return cur.fetchall()
@@ -255,8 +512,8 @@ class DatabaseService:
                            headquarters_location, founded_date, description,
                            officers, board_members, data_source
                     FROM mining_companies
-                    WHERE officers @> '[{"title": %s}]'::jsonb
-                       OR board_members @> '[{"title": %s}]'::jsonb
+                    WHERE officers @> jsonb_build_array(jsonb_build_object('title', %s))
+                       OR board_members @> jsonb_build_array(jsonb_build_object('title', %s))
                     ORDER BY company_name;
                 """, (role, role))
                 return cur.fetchall()
@@ -269,12 +526,15 @@ class DatabaseService:
         """
         with self.get_connection() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                # LATERAL expands each officers array once; the old
+                # set-returning calls in the SELECT list unnested it twice
                 cur.execute("""
                     SELECT company_name,
-                           jsonb_array_elements(officers)->>'name' as officer_name,
-                           jsonb_array_elements(officers)->>'title' as officer_title,
+                           o->>'name' as officer_name,
+                           o->>'title' as officer_title,
                            data_source->>'officers' as data_source
                     FROM mining_companies
+                    CROSS JOIN LATERAL jsonb_array_elements(officers) AS o
                     WHERE jsonb_array_length(officers) > 0
                     ORDER BY company_name, officer_name;
                 """)
@@ -288,12 +548,14 @@ class DatabaseService:
         """
         with self.get_connection() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                # Same single LATERAL expansion as get_all_officers
                 cur.execute("""
                     SELECT company_name,
-                           jsonb_array_elements(board_members)->>'name' as member_name,
-                           jsonb_array_elements(board_members)->>'title' as member_title,
+                           m->>'name' as member_name,
+                           m->>'title' as member_title,
                            data_source->>'board_members' as data_source
                     FROM mining_companies
+                    CROSS JOIN LATERAL jsonb_array_elements(board_members) AS m
                     WHERE jsonb_array_length(board_members) > 0
                     ORDER BY company_name, member_name;
                 """)
@@ -2,12 +2,30 @@
 
 import os
 import json
+import logging
+import string
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
 class FileService:
     """Service for managing local file operations."""
-    
+
+    # Lowercasing and the space/slash replacement fold into one
+    # translation table, so normalization is a single C-level pass instead
+    # of three chained string allocations
+    _NORM_TABLE = str.maketrans(
+        string.ascii_uppercase + ' /',
+        string.ascii_lowercase + '__'
+    )
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize the file service.
         
@@ -31,6 +49,24 @@ class FileService:
         # Create directories if they don't exist
         self.raw_dir.mkdir(parents=True, exist_ok=True)
         self.company_files_dir.mkdir(parents=True, exist_ok=True)
+
+        # Index the directory once: existence checks become set
+        # membership instead of one stat syscall per lookup
+        self._known_files = {
+            entry.name for entry in os.scandir(self.company_files_dir)
+            if entry.is_file()
+        }
+
+    def refresh_index(self) -> None:
+        """Re-scan the company files directory.
+
+        Call after another process may have written files; normal reads
+        and saves keep the index current on their own.
+        """
+        self._known_files = {
+            entry.name for entry in os.scandir(self.company_files_dir)
+            if entry.is_file()
+        }
     
     def _normalize_filename(self, name: str) -> str:
         """Normalize a name for use in filenames.
@@ -41,8 +77,9 @@ class FileService:
         Returns:
             Normalized name
         """
-        return name.lower().replace(' ', '_').replace('/', '_')
-    
+        return name.translate(self._NORM_TABLE)
+
+    @lru_cache(maxsize=4096)
     def get_company_file_path(self, company_name: str) -> Path:
         """Get the path to a company's data file.
         
@@ -65,71 +102,73 @@ class FileService:
             Company data if found, None otherwise
         """
         file_path = self.get_company_file_path(company_name)
-        if not file_path.exists():
-            return None
-        
+        if file_path.name not in self._known_files:
+            # Fall back to one stat in case the file appeared since the
+            # last scan, then remember the answer
+            if not file_path.exists():
+                return None
+            self._known_files.add(file_path.name)
+
         try:
+            if orjson is not None:
+                with open(file_path, 'rb') as f:
+                    return orjson.loads(f.read())
             with open(file_path, 'r') as f:
                 return json.load(f)
         except Exception as e:
-            print(f"Error reading {file_path}: {str(e)}")
+            logger.error("Error reading %s: %s", file_path, e)
             return None
     
-    def get_local_officers(self, company_name: str) -> Optional[List[Dict[str, str]]]:
-        """Get officers from local file.
-        
+    def _extract_people(self, company_name: str, field: str) -> Optional[List[Dict[str, str]]]:
+        """Read and validate a name/title list from a company's file.
+
+        Shared by the officer and board accessors; str() is skipped when
+        the value is already a string, the common case.
+
         Args:
             company_name: Name of the company
-            
+            field: JSON field holding the list ('officers' or 'board_members')
+
         Returns:
-            List of officer dictionaries if found, None otherwise
+            List of validated dictionaries if found, None otherwise
         """
         data = self.read_company_data(company_name)
         if not data:
             return None
-        
-        officers = data.get('officers')
-        if not officers or not isinstance(officers, list):
+
+        people = data.get(field)
+        if not people or not isinstance(people, list):
             return None
-        
-        # Validate officer data
-        valid_officers = []
-        for officer in officers:
-            if isinstance(officer, dict) and 'name' in officer and 'title' in officer:
-                valid_officers.append({
-                    'name': str(officer['name']),
-                    'title': str(officer['title'])
-                })
-        
-        return valid_officers if valid_officers else None
-    
+
+        valid = [
+            {'name': p['name'] if isinstance(p['name'], str) else str(p['name']),
+             'title': p['title'] if isinstance(p['title'], str) else str(p['title'])}
+            for p in people
+            if isinstance(p, dict) and 'name' in p and 'title' in p
+        ]
+        return valid if valid else None
+
+    def get_local_officers(self, company_name: str) -> Optional[List[Dict[str, str]]]:
+        """Get officers from local file.
+
+        Args:
+            company_name: Name of the company
+
+        Returns:
+            List of officer dictionaries if found, None otherwise
+        """
+        return self._extract_people(company_name, 'officers')
+
     def get_local_board(self, company_name: str) -> Optional[List[Dict[str, str]]]:
         """Get board members from local file.
-        
+
         Args:
             company_name: Name of the company
-            
+
         Returns:
             List of board member dictionaries if found, None otherwise
         """
-        data = self.read_company_data(company_name)
-        if not data:
-            return None
-        
-        board = data.get('board_members')
-        if not board or not isinstance(board, list):
-            return None
-        
-        # Validate board member data
-        valid_members = []
-        for member in board:
-            if isinstance(member, dict) and 'name' in member and 'title' in member:
-                valid_members.append({
-                    'name': str(member['name']),
-                    'title': str(member['title'])
-                })
-        
-        return valid_members if valid_members else None
+        return self._extract_people(company_name, 'board_members')
     
     def save_company_data(self, company_name: str, data: Dict) -> bool:
         """Save data for a company to local file.
@@ -143,9 +182,14 @@ class FileService:
         """
         file_path = self.get_company_file_path(company_name)
         try:
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            if orjson is not None:
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(file_path, 'w') as f:
+                    json.dump(data, f, indent=2)
+            self._known_files.add(file_path.name)
             return True
         except Exception as e:
-            print(f"Error saving {file_path}: {str(e)}")
+            logger.error("Error saving %s: %s", file_path, e)
             return False 
\ No newline at end of file
@@ -1,13 +1,25 @@
 """Service for managing LLM operations."""
 
+import asyncio
+import hashlib
+import json
+import logging
 import os
+from pathlib import Path
 from typing import List, Dict, Optional, Any
-import openai
+from openai import AsyncOpenAI, OpenAI
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
 class LLMService:
     """Service for managing LLM operations."""
-    
+
+    # Frozensets make the title membership tests O(1) instead of a
+    # linear scan per person
+    _CEO_TITLES = frozenset({'chief executive officer', 'ceo'})
+    _CHAIR_TITLES = frozenset({'chairman', 'chairman of the board'})
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize the LLM service.
         
@@ -17,20 +29,53 @@ class LLMService:
         self.api_key = config['openai_api_key']
         if not self.api_key:
             raise ValueError("OpenAI API key not found in configuration")
-        openai.api_key = self.api_key
+        # One long-lived client for the whole service: its httpx pool
+        # keeps connections alive, so repeat calls skip the TCP+TLS
+        # handshake. Safe to share across threads.
+        self.client = OpenAI(api_key=self.api_key)
+        # Async twin for pipelines that fan extractions out with
+        # asyncio.gather; the semaphore bounds in-flight requests so a
+        # large batch doesn't trip the API rate limit
+        self.aclient = AsyncOpenAI(api_key=self.api_key)
+        self._sem = asyncio.Semaphore(8)
         self.config = config
-        
-    def extract_management_info(self, company_name: str, content: str) -> Dict[str, List[Dict[str, str]]]:
-        """Extract management information using LLM.
-        
-        Args:
-            company_name: Name of the company
-            content: Text content to analyze
-            
-        Returns:
-            Dictionary containing officers and board members
-        """
-        prompt = f"""Analyze the following text about {company_name} and extract information about:
+
+        # Extractions are memoized by content hash: re-running a pipeline
+        # over unchanged pages costs a dict/file lookup instead of a GPT-4
+        # call. The on-disk layer survives process restarts.
+        self._cache_dir = Path(config.get('llm_cache_dir', '.llm_cache'))
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._memo: Dict[str, Dict[str, List[Dict[str, str]]]] = {}
+
+    def _cache_key(self, company_name: str, content: str) -> str:
+        """Hash the extraction inputs into a cache key."""
+        return hashlib.sha256(f"{company_name}\0{content}".encode()).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[Dict[str, List[Dict[str, str]]]]:
+        """Look a key up in the in-memory then on-disk cache."""
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+        cache_file = self._cache_dir / f"{key}.json"
+        try:
+            cached = json.loads(cache_file.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+        self._memo[key] = cached
+        return cached
+
+    def _cache_put(self, key: str, parsed: Dict[str, List[Dict[str, str]]]) -> None:
+        """Store a successful extraction in both cache layers."""
+        self._memo[key] = parsed
+        try:
+            (self._cache_dir / f"{key}.json").write_text(json.dumps(parsed))
+        except OSError as e:
+            logger.error("Error writing LLM cache entry: %s", e)
+
+    @staticmethod
+    def _build_prompt(company_name: str, content: str) -> str:
+        """Build the extraction prompt shared by the sync and async paths."""
+        return f"""Analyze the following text about {company_name} and extract information about:
 1. Chief Executive Officer (CEO)
 2. Chairman of the Board
 
@@ -54,25 +99,101 @@ Response format:
     ]
 }}"""
 
-        try:
-            response = openai.ChatCompletion.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant that extracts management information from company text."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=500
-            )
-            
-            # Parse the response
-            result = response.choices[0].message.content
-            return eval(result)  # Convert string to dict
-            
-        except Exception as e:
-            print(f"Error in LLM extraction: {str(e)}")
-            return {"officers": [], "board_members": []}
-    
+    def extract_management_info(self, company_name: str, content: str) -> Dict[str, List[Dict[str, str]]]:
+        """Extract management information using LLM.
+
+        Args:
+            company_name: Name of the company
+            content: Text content to analyze
+
+        Returns:
+            Dictionary containing officers and board members
+        """
+        prompt = self._build_prompt(company_name, content)
+
+        key = self._cache_key(company_name, content)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        # One retry covers the occasional malformed reply; anything else
+        # fails straight to the empty result
+        for attempt in range(2):
+            try:
+                response = self.client.chat.completions.create(
+                    model="gpt-4",
+                    messages=[
+                        {"role": "system", "content": "You are a helpful assistant that extracts management information from company text."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.3,
+                    max_tokens=500,
+                    response_format={"type": "json_object"}
+                )
+
+                # Parse the response with a real JSON parser; JSON mode
+                # guarantees the reply is a strict JSON object
+                result = response.choices[0].message.content
+                parsed = json.loads(result)
+                self._cache_put(key, parsed)
+                return parsed
+
+            except json.JSONDecodeError as e:
+                logger.error("Malformed JSON from LLM (attempt %d): %s", attempt + 1, e)
+            except Exception as e:
+                logger.error("Error in LLM extraction: %s", e)
+                break
+
+        return {"officers": [], "board_members": []}
+
+    async def aextract_management_info(self, company_name: str, content: str) -> Dict[str, List[Dict[str, str]]]:
+        """Async counterpart of extract_management_info.
+
+        Dispatch many companies with asyncio.gather to overlap the
+        request latency; the service-level semaphore caps concurrent
+        calls at 8. Shares the content-hash cache with the sync path.
+
+        Args:
+            company_name: Name of the company
+            content: Text content to analyze
+
+        Returns:
+            Dictionary containing officers and board members
+        """
+        key = self._cache_key(company_name, content)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        prompt = self._build_prompt(company_name, content)
+
+        for attempt in range(2):
+            try:
+                async with self._sem:
+                    response = await self.aclient.chat.completions.create(
+                        model="gpt-4",
+                        messages=[
+                            {"role": "system", "content": "You are a helpful assistant that extracts management information from company text."},
+                            {"role": "user", "content": prompt}
+                        ],
+                        temperature=0.3,
+                        max_tokens=500,
+                        response_format={"type": "json_object"}
+                    )
+
+                result = response.choices[0].message.content
+                parsed = json.loads(result)
+                self._cache_put(key, parsed)
+                return parsed
+
+            except json.JSONDecodeError as e:
+                logger.error("Malformed JSON from LLM (attempt %d): %s", attempt + 1, e)
+            except Exception as e:
+                logger.error("Error in LLM extraction: %s", e)
+                break
+
+        return {"officers": [], "board_members": []}
+
     def has_key_positions(self, officers: List[Dict[str, str]], board_members: List[Dict[str, str]]) -> bool:
         """Check if key positions (CEO and Chairman) are present.
         
@@ -83,9 +204,9 @@ Response format:
         Returns:
             True if both CEO and Chairman are found, False otherwise
         """
-        has_ceo = any(o['title'].lower() in ['chief executive officer', 'ceo'] for o in officers)
-        has_chairman = any(m['title'].lower() in ['chairman', 'chairman of the board'] for m in board_members)
-        return has_ceo and has_chairman 
+        has_ceo = any(o.get('title', '').lower() in self._CEO_TITLES for o in officers)
+        has_chairman = any(m.get('title', '').lower() in self._CHAIR_TITLES for m in board_members)
+        return has_ceo and has_chairman
     
     def update_company_management(self, company_id: int, 
                                 officers: List[Dict[str, str]], 
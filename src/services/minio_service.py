@@ -1,5 +1,8 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from minio import Minio
 from pathlib import Path
 from urllib.parse import urlparse, unquote
@@ -22,15 +25,20 @@ class MinioService:
             secure=parsed_url.scheme == "https"
         )
         self.bucket_name = settings.minio.bucket_name
+        self._objects_by_domain: Optional[Dict[str, List[str]]] = None
 
     def ensure_bucket_exists(self) -> None:
         """Ensure the configured bucket exists, create if it doesn't."""
         if not self.client.bucket_exists(self.bucket_name):
             self.client.make_bucket(self.bucket_name)
 
-    def count_objects(self) -> int:
-        """Count total number of objects in the bucket."""
-        objects = self.client.list_objects(self.bucket_name)
+    def count_objects(self, prefix: str = "") -> int:
+        """Count total number of objects in the bucket.
+
+        Streams the listing and counts page by page; keys are never
+        materialized.
+        """
+        objects = self.client.list_objects(self.bucket_name, prefix=prefix)
         return sum(1 for _ in objects)
 
     def list_objects(self, prefix: str = "") -> List[str]:
@@ -38,6 +46,48 @@ class MinioService:
         objects = self.client.list_objects(self.bucket_name, prefix=prefix)
         return [obj.object_name for obj in objects]
 
+    def list_objects_parallel(self, prefixes: List[str], max_workers: int = 8) -> List[str]:
+        """List several disjoint key prefixes concurrently and merge the results.
+
+        The sync client walks each listing's pages serially; fanning the
+        prefixes out over threads overlaps those page round trips. Useful
+        for splitting a huge keyspace (e.g. by leading character).
+        """
+        if not prefixes:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(prefixes))) as pool:
+            names: List[str] = []
+            for chunk in pool.map(self.list_objects, prefixes):
+                names.extend(chunk)
+            return names
+
+    def list_objects_by_domain(self) -> Dict[str, List[str]]:
+        """Group every object name in the bucket by company domain.
+
+        The bucket is enumerated once per service instance and the result
+        memoized, so processing M companies costs one listing plus an O(1)
+        dict lookup per company instead of M full enumerations. Keys are
+        URL-encoded page URLs; the domain is parsed out with the leading
+        www. stripped.
+        """
+        if self._objects_by_domain is None:
+            by_domain: Dict[str, List[str]] = {}
+            for name in self.iter_objects():
+                domain = urlparse(unquote(name)).netloc.replace('www.', '')
+                if domain:
+                    by_domain.setdefault(domain, []).append(name)
+            self._objects_by_domain = by_domain
+        return self._objects_by_domain
+
+    def iter_objects(self, prefix: str = ""):
+        """Yield object names as listing pages arrive.
+
+        Unlike list_objects, nothing is materialized: callers filtering a
+        large bucket see names as soon as each page comes back.
+        """
+        for obj in self.client.list_objects(self.bucket_name, prefix=prefix):
+            yield obj.object_name
+
     def download_sample(self, sample_size: int, output_dir: Path, prefix: str = "") -> List[str]:
         """Download a sample of objects from the bucket.
         
@@ -52,24 +102,34 @@ class MinioService:
         # Ensure output directory exists
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Get list of objects
-        objects = list(self.client.list_objects(self.bucket_name, prefix=prefix))
-        
-        # Take sample (or all if sample_size > total objects)
-        sample = objects[:min(sample_size, len(objects))]
-        
-        downloaded_files = []
-        for obj in sample:
+        # Take the sample straight off the listing iterator: only
+        # sample_size keys are ever pulled, not the whole bucket
+        sample = list(islice(
+            self.client.list_objects(self.bucket_name, prefix=prefix),
+            sample_size
+        ))
+
+        if not sample:
+            return []
+
+        def fetch(obj) -> str:
             # Create a safe filename using a hash of the object name
             safe_name = hashlib.md5(obj.object_name.encode()).hexdigest()
             output_path = output_dir / f"{safe_name}.json"
-            
-            # Download the object
-            self.client.fget_object(
-                self.bucket_name,
-                obj.object_name,
-                str(output_path)
-            )
-            downloaded_files.append(str(output_path))
-            
-        return downloaded_files 
\ No newline at end of file
+
+            # Stream the body straight to disk in 1 MiB chunks over the
+            # client's shared connection pool; fget_object sets up and
+            # tears down more per call than the copy itself costs
+            response = self.client.get_object(self.bucket_name, obj.object_name)
+            try:
+                with open(output_path, 'wb') as f:
+                    shutil.copyfileobj(response, f, length=1 << 20)
+            finally:
+                response.close()
+                response.release_conn()
+            return str(output_path)
+
+        # Overlap the per-object HTTP round trips; the minio client is
+        # thread-safe for concurrent object operations
+        with ThreadPoolExecutor(max_workers=min(8, len(sample))) as pool:
+            return list(pool.map(fetch, sample)) 
\ No newline at end of file
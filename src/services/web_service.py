@@ -1,14 +1,70 @@
 """Service for handling website scraping operations."""
 
+import re
+import threading
 import time
 import requests
-from typing import Optional
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Iterator, Optional
+import lxml.html
+from lxml import etree
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+# Compiled once: pulls every text node that is not inside a script or
+# style element, replacing the decompose/get_text/splitlines pipeline
+_TEXT_XPATH = etree.XPath(
+    "//text()[not(ancestor::script) and not(ancestor::style)]"
+)
+
+# Keywords that might indicate management/board pages, compiled into one
+# alternation so each link costs a single scan instead of ten Python
+# substring searches
+_KEYWORDS = (
+    'management', 'leadership', 'team', 'board', 'directors',
+    'governance', 'about', 'company', 'corporate', 'executives'
+)
+_KEYWORD_RE = re.compile('|'.join(map(re.escape, _KEYWORDS)))
+
+# One C-level pass collapses any whitespace run; cheaper than
+# re-splitting every text node in Python
+_WS_RE = re.compile(r'\s+')
+
+# One libxml2 parser context per process, built lazily so worker
+# processes construct their own instead of unpickling one
+_PARSE_PARSER = None
+
+# Below this many pages the fork/pickle overhead of a process pool
+# outweighs the parallel parse
+_PARALLEL_PARSE_MIN = 8
+
+# Anything larger is a catalog/download, not a management page; skipping
+# it caps the per-worker memory spike
+_MAX_PAGE_BYTES = 5_000_000
+
+
+def _extract_text(content: str) -> str:
+    """Extract normalized text from one HTML page.
+
+    Top-level so ProcessPoolExecutor can pickle it; parsing is CPU-bound,
+    so batches of pages fan out across cores.
+    """
+    global _PARSE_PARSER
+    if _PARSE_PARSER is None:
+        _PARSE_PARSER = lxml.html.HTMLParser(recover=True, remove_comments=True)
+    doc = lxml.html.fromstring(content, parser=_PARSE_PARSER)
+    return _WS_RE.sub(' ', ' '.join(_TEXT_XPATH(doc))).strip()
 
 class WebService:
     """Service for handling website scraping operations."""
-    
+
+    # Slots skip the per-instance __dict__, shaving the attribute lookups
+    # that run once per link/page in the hot loops
+    __slots__ = ('rate_limit', '_next_allowed', '_rate_lock', 'session',
+                 '_page_cache', '_page_cache_size', '_links_cache')
+
     def __init__(self, rate_limit: float = 1.0):
         """Initialize the web service.
         
@@ -16,19 +72,105 @@ class WebService:
             rate_limit: Minimum time between requests in seconds
         """
         self.rate_limit = rate_limit
-        self.last_request = 0
+        # Monotonic timestamp before which the next request must wait;
+        # immune to wall-clock jumps and needs one clock read per call
+        self._next_allowed = 0.0
+        # Serializes the rate-limit bookkeeping so concurrent fetches
+        # still space their requests correctly
+        self._rate_lock = threading.Lock()
         self.session = requests.Session()
+        # A pool sized for the concurrent fetchers keeps sockets (and
+        # their TLS handshakes) alive across same-host requests, and the
+        # retry policy absorbs transient 429/5xx responses with backoff
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                # On 429/503, sleep for the server's Retry-After instead
+                # of the fixed backoff so throttled hosts are not hammered
+                respect_retry_after_header=True
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            # Ask for compressed bodies; requests decompresses
+            # transparently
+            'Accept-Encoding': 'gzip, br'
         })
+        # Companies share CDN/landing pages, so fetches and link scans
+        # are memoized by normalized URL in bounded LRU caches
+        self._page_cache: OrderedDict = OrderedDict()
+        self._page_cache_size = 0
+        self._links_cache: OrderedDict = OrderedDict()
+
+    _URL_CACHE_SIZE = 4096
+    # Page bodies can be multiple MB each, so the page cache is bounded
+    # by total size rather than entry count; 4096 full bodies would be
+    # gigabytes in the worst case
+    _PAGE_CACHE_MAX_CHARS = 64 << 20
+
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """Canonicalize a URL into a cache key."""
+        parts = urlsplit(url.strip())
+        host = parts.netloc.lower()
+        if parts.scheme == 'http' and host.endswith(':80'):
+            host = host[:-3]
+        elif parts.scheme == 'https' and host.endswith(':443'):
+            host = host[:-4]
+        return urlunsplit(
+            (parts.scheme.lower(), host, parts.path.rstrip('/'), parts.query, '')
+        )
+
+    def _cache_get(self, cache: OrderedDict, key: str):
+        """Return a cached value and mark it most recently used."""
+        try:
+            value = cache.pop(key)
+        except KeyError:
+            return None
+        cache[key] = value
+        return value
+
+    def _cache_put(self, cache: OrderedDict, key: str, value) -> None:
+        """Cache a value, evicting the least recently used entry."""
+        cache[key] = value
+        if len(cache) > self._URL_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _page_cache_put(self, key: str, text: str) -> None:
+        """Cache a page body, evicting LRU entries past the size budget.
+
+        len() counts characters, not encoded bytes, but tracks retained
+        memory closely enough to serve as the budget.
+        """
+        old = self._page_cache.pop(key, None)
+        if old is not None:
+            self._page_cache_size -= len(old)
+        self._page_cache[key] = text
+        self._page_cache_size += len(text)
+        while (self._page_cache_size > self._PAGE_CACHE_MAX_CHARS
+               and self._page_cache):
+            _, evicted = self._page_cache.popitem(last=False)
+            self._page_cache_size -= len(evicted)
     
     def _wait_for_rate_limit(self):
-        """Wait to respect rate limiting."""
-        now = time.time()
-        time_since_last = now - self.last_request
-        if time_since_last < self.rate_limit:
-            time.sleep(self.rate_limit - time_since_last)
-        self.last_request = time.time()
+        """Wait to respect rate limiting (thread-safe).
+
+        Advancing _next_allowed from its previous value rather than from
+        "after the sleep" keeps the schedule drift-free: slots stay
+        rate_limit apart no matter how long each sleep actually took.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_allowed - now
+            if wait > 0:
+                time.sleep(wait)
+            self._next_allowed = max(now, self._next_allowed) + self.rate_limit
     
     def get_page_content(self, url: str) -> Optional[str]:
         """Get the content of a webpage.
@@ -39,49 +181,132 @@ class WebService:
         Returns:
             Page content if successful, None otherwise
         """
+        key = self._normalize_url(url)
+        cached = self._cache_get(self._page_cache, key)
+        if cached is not None:
+            return cached
         try:
             self._wait_for_rate_limit()
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            return response.text
+            # stream=True defers the body download until the headers have
+            # ruled out non-HTML and oversize responses
+            with self.session.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                content_type = response.headers.get('content-type', '').lower()
+                if content_type and not content_type.startswith(
+                        ('text/html', 'application/xhtml')):
+                    return None
+                if int(response.headers.get('content-length') or 0) > _MAX_PAGE_BYTES:
+                    return None
+                # Content-Length is optional (chunked responses omit it),
+                # so the cap is also enforced while reading: the download
+                # stops as soon as the body goes over, instead of pulling
+                # the whole thing just to discard it
+                size = 0
+                chunks = []
+                for chunk in response.iter_content(65536):
+                    size += len(chunk)
+                    if size > _MAX_PAGE_BYTES:
+                        return None
+                    chunks.append(chunk)
+                text = b''.join(chunks).decode(
+                    response.encoding or 'utf-8', errors='replace'
+                )
+            self._page_cache_put(key, text)
+            return text
         except Exception as e:
             print(f"Error fetching {url}: {str(e)}")
             return None
-    
+
+    def iter_page_chunks(self, url: str, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Stream a page's body as raw chunks.
+
+        Args:
+            url: URL to fetch
+            chunk_size: Bytes per chunk
+
+        Yields:
+            Chunks of the response body as they arrive
+        """
+        try:
+            self._wait_for_rate_limit()
+            with self.session.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                yield from response.iter_content(chunk_size)
+        except Exception as e:
+            print(f"Error fetching {url}: {str(e)}")
+
     def get_management_pages(self, base_url: str) -> list[str]:
         """Get URLs of pages likely to contain management information.
-        
+
+        Link discovery streams: each chunk of the landing page is fed to
+        an incremental parser and anchors are inspected (and released) as
+        soon as they close, so a huge page never lives in memory and the
+        first matches surface before the download finishes.
+
         Args:
             base_url: Company website base URL
-            
+
         Returns:
             List of relevant page URLs
         """
-        content = self.get_page_content(base_url)
-        if not content:
-            return []
-        
-        soup = BeautifulSoup(content, 'html.parser')
-        management_urls = []
-        
-        # Keywords that might indicate management/board pages
-        keywords = [
-            'management', 'leadership', 'team', 'board', 'directors',
-            'governance', 'about', 'company', 'corporate', 'executives'
-        ]
-        
-        # Find links containing keywords
-        for link in soup.find_all('a', href=True):
+        cache_key = self._normalize_url(base_url)
+        cached = self._cache_get(self._links_cache, cache_key)
+        if cached is not None:
+            return list(cached)
+
+        parser = etree.HTMLPullParser(events=('end',), tag='a', recover=True)
+        management_urls = set()
+        # Parse the base once; per-link urljoin would re-parse it for
+        # every anchor on the page
+        base_parts = urlsplit(base_url)
+        base_netloc = base_parts.netloc.lower()
+        base_origin = f"{base_parts.scheme}://{base_parts.netloc}"
+        # Bind the per-link callables to locals; pages can carry
+        # thousands of anchors
+        kw_search = _KEYWORD_RE.search
+        feed = parser.feed
+        read_events = parser.read_events
+
+        def anchor_events():
+            for chunk in self.iter_page_chunks(base_url):
+                feed(chunk)
+                yield from read_events()
+            # close() flushes anchors still open when the stream ends --
+            # truncated or malformed pages (the case recover=True exists
+            # for) would otherwise never emit their end events
+            try:
+                parser.close()
+            except etree.XMLSyntaxError:
+                pass
+            yield from read_events()
+
+        for _, link in anchor_events():
             href = link.get('href')
-            text = link.get_text().lower()
-            
-            # Check if link text or URL contains keywords
-            if any(keyword in text or keyword in href.lower() for keyword in keywords):
-                full_url = urljoin(base_url, href)
-                if full_url.startswith(base_url):  # Only include internal links
-                    management_urls.append(full_url)
-        
-        return list(set(management_urls))  # Remove duplicates
+            if href:
+                text = ''.join(link.itertext()).lower()
+                href_lower = href.lower()
+
+                # Check if link text or URL contains keywords
+                if kw_search(text) or kw_search(href_lower):
+                    if href.startswith('/') and not href.startswith('//'):
+                        # Site-relative link, the overwhelmingly
+                        # common case: one concatenation, host known
+                        # to match
+                        management_urls.add(base_origin + href)
+                    else:
+                        full_url = urljoin(base_url, href)
+                        if full_url not in management_urls:
+                            # Only include internal links
+                            if urlsplit(full_url).netloc.lower() == base_netloc:
+                                management_urls.add(full_url)
+            # Release the subtree so memory stays bounded at roughly
+            # one chunk regardless of page size
+            link.clear()
+
+        urls = list(management_urls)
+        if urls:
+            self._cache_put(self._links_cache, cache_key, urls)
+        return urls
     
     def get_website_content(self, url: str) -> Optional[str]:
         """Get all relevant content from a company website.
@@ -98,27 +323,19 @@ class WebService:
             print(f"No management pages found for {url}")
             return None
         
-        # Fetch content from each page
-        all_content = []
-        for page_url in management_urls:
-            content = self.get_page_content(page_url)
-            if content:
-                # Parse HTML and extract text
-                soup = BeautifulSoup(content, 'html.parser')
-                
-                # Remove script and style elements
-                for element in soup(['script', 'style']):
-                    element.decompose()
-                
-                # Get text content
-                text = soup.get_text()
-                
-                # Clean up whitespace
-                lines = (line.strip() for line in text.splitlines())
-                chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                text = ' '.join(chunk for chunk in chunks if chunk)
-                
-                all_content.append(text)
+        # Fetch the pages concurrently: request starts stay spaced by the
+        # rate limiter, but the response waits overlap instead of
+        # stacking serially
+        with ThreadPoolExecutor(max_workers=min(8, len(management_urls))) as pool:
+            pages = [p for p in pool.map(self.get_page_content, management_urls) if p]
+
+        # Parsing is CPU-bound; big batches fan out across cores while
+        # small ones stay in-process to skip the fork/pickle overhead
+        if len(pages) >= _PARALLEL_PARSE_MIN:
+            with ProcessPoolExecutor() as executor:
+                all_content = list(executor.map(_extract_text, pages, chunksize=4))
+        else:
+            all_content = [_extract_text(content) for content in pages]
         
         if not all_content:
             print(f"No content extracted from {url}")
@@ -6,9 +6,7 @@ from typing import List, Dict
 import csv
 
 from src.config import settings
-
-# Import the module to test (will be created later)
-# from src.output_writer.writer import OutputWriter
+from src.output_writer.writer import OutputWriter
 
 class TestOutputWriter:
     """Test suite for the output writer module."""
@@ -36,28 +34,58 @@ class TestOutputWriter:
 
     def test_write_csv_valid_data(self, sample_management_data, output_file):
         """Test writing valid data to CSV."""
-        # TODO: Implement test once we have the actual module
-        pass
+        writer = OutputWriter()
+        written = writer.write_csv(sample_management_data, output_file)
+
+        assert written == 2
+        with open(output_file, newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert rows == sample_management_data
 
     def test_write_csv_empty_data(self, output_file):
         """Test writing empty data to CSV."""
-        # TODO: Implement test once we have the actual module
-        pass
+        writer = OutputWriter()
+        written = writer.write_csv([], output_file)
+
+        assert written == 0
+        with open(output_file, newline='') as f:
+            reader = csv.DictReader(f)
+            assert reader.fieldnames == OutputWriter.FIELDNAMES
+            assert list(reader) == []
 
     def test_write_csv_invalid_data(self, output_file):
         """Test writing invalid data to CSV."""
-        # TODO: Implement test once we have the actual module
-        pass
+        writer = OutputWriter()
+        with pytest.raises(ValueError):
+            writer.write_csv([{"source": "Test Corp"}], output_file)
+        with pytest.raises(ValueError):
+            writer.write_csv([None], output_file)
 
     def test_write_csv_file_permissions(self, sample_management_data, output_file):
         """Test handling of file permission issues."""
-        # TODO: Implement test once we have the actual module
-        pass
+        writer = OutputWriter()
+        missing_dir = output_file.parent / "does_not_exist" / output_file.name
+        with pytest.raises(OSError):
+            writer.write_csv(sample_management_data, missing_dir)
 
     def test_write_csv_duplicate_entries(self, sample_management_data, output_file):
         """Test handling of duplicate entries."""
-        # TODO: Implement test once we have the actual module
-        pass
+        # Exact repeat plus a case-variant of the same person
+        duplicate = dict(sample_management_data[0])
+        case_variant = {
+            "source": "Test Corp",
+            "name": "JOHN DOE",
+            "role": "chief executive officer"
+        }
+        records = sample_management_data + [duplicate, case_variant]
+
+        writer = OutputWriter()
+        written = writer.write_csv(records, output_file)
+
+        assert written == 2
+        with open(output_file, newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert rows == sample_management_data
 
     def test_use_settings_output_dir(self):
         """Test using output directory from settings."""
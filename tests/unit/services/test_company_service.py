@@ -3,26 +3,30 @@
 import pytest
 from pathlib import Path
 import csv
-import tempfile
 from typing import List
 
 from src.services.company_service import CompanyService
 from src.models.company import Company
 
 
-@pytest.fixture
-def sample_companies_file() -> Path:
+# Module-scoped: the tests are read-only against the service, so the
+# CSV is written and parsed once instead of once per test. pytest's tmp
+# directory handling also cleans up for us, unlike delete=False
+# tempfiles
+@pytest.fixture(scope="module")
+def sample_companies_file(tmp_path_factory) -> Path:
     """Create a temporary CSV file with sample company data."""
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
+    path = tmp_path_factory.mktemp("companies") / "companies.csv"
+    with open(path, 'w', newline='') as f:
         writer = csv.writer(f)
         writer.writerow(['URL', 'Name', 'Exchange', 'Ticker'])
         writer.writerow(['https://example1.com', 'Company One', 'NYSE', 'ONE'])
         writer.writerow(['https://example2.com', 'Company Two', 'TSX', 'TWO'])
         writer.writerow(['https://example3.com', 'Company Three', 'NYSE', 'THREE'])
-        return Path(f.name)
+    return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def company_service(sample_companies_file) -> CompanyService:
     """Create a CompanyService instance with sample data."""
     return CompanyService(companies_file=sample_companies_file)
@@ -1,16 +1,27 @@
+import io
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 from pathlib import Path
 from minio import Minio
 from src.services.minio_service import MinioService
 
-@pytest.fixture
-def mock_minio_client():
-    with patch('src.services.minio_service.Minio') as mock_minio:
-        # Create a mock client instance
-        mock_client = Mock()
-        mock_minio.return_value = mock_client
-        yield mock_client
+# Module-scoped: the patch start/stop cycle runs once instead of per
+# test; the autouse fixture below wipes per-test state off the shared
+# client
+@pytest.fixture(scope="module")
+def mock_minio_client(request):
+    patcher = patch('src.services.minio_service.Minio')
+    mock_minio = patcher.start()
+    request.addfinalizer(patcher.stop)
+    # Create a mock client instance
+    mock_client = Mock()
+    mock_minio.return_value = mock_client
+    return mock_client
+
+@pytest.fixture(autouse=True)
+def _reset_minio_client(mock_minio_client):
+    mock_minio_client.reset_mock(return_value=True, side_effect=True)
 
 @pytest.fixture
 def minio_service(mock_minio_client):
@@ -18,13 +29,9 @@ def minio_service(mock_minio_client):
 
 @pytest.fixture
 def sample_objects():
-    # Create mock objects that mimic Minio's Object class
-    objects = []
-    for i in range(5):
-        obj = Mock()
-        obj.object_name = f"test_file_{i}.txt"
-        objects.append(obj)
-    return objects
+    # SimpleNamespace mimics Minio's Object for the .object_name access
+    # the tests need, at a fraction of Mock's construction cost
+    return [SimpleNamespace(object_name=f"test_file_{i}.txt") for i in range(5)]
 
 def test_init_creates_client_with_correct_settings(mock_minio_client):
     service = MinioService()
@@ -65,12 +72,17 @@ def test_download_sample_creates_output_dir(minio_service, tmp_path):
 
 def test_download_sample_downloads_correct_number(minio_service, sample_objects, tmp_path):
     minio_service.client.list_objects.return_value = sample_objects
+    # get_object returns a streaming response; a fresh BytesIO-backed
+    # mock per call gives copyfileobj real bytes to read
+    minio_service.client.get_object.side_effect = (
+        lambda *args, **kwargs: Mock(read=io.BytesIO(b"{}").read)
+    )
     output_dir = tmp_path / "test_output"
-    
+
     downloaded_files = minio_service.download_sample(3, output_dir)
-    
-    # Should have called fget_object 3 times
-    assert minio_service.client.fget_object.call_count == 3
+
+    # Should have called get_object 3 times
+    assert minio_service.client.get_object.call_count == 3
     assert len(downloaded_files) == 3
 
 def test_download_sample_handles_empty_bucket(minio_service, tmp_path):
@@ -80,4 +92,4 @@ def test_download_sample_handles_empty_bucket(minio_service, tmp_path):
     downloaded_files = minio_service.download_sample(5, output_dir)
     
     assert len(downloaded_files) == 0
-    minio_service.client.fget_object.assert_not_called() 
\ No newline at end of file
+    minio_service.client.get_object.assert_not_called()
\ No newline at end of file